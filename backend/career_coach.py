@@ -64,6 +64,13 @@ class CareerAnalysis(BaseModel):
     actionable_recommendations: List[str]
     potential_career_paths: List[Dict[str, str]]
 
+# Shared async client so career analysis never blocks the event loop
+_GROQ_CLIENT = groq.AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
+
+async def close_client() -> None:
+    """Close the shared Groq client and its connection pool; called on app shutdown."""
+    await _GROQ_CLIENT.close()
+
 # Initialize Jinja2 environment
 template_dir = os.path.join(os.path.dirname(__file__), 'templates')
 env = Environment(loader=FileSystemLoader(template_dir))
@@ -84,12 +91,6 @@ async def analyze_career(resume_text: str) -> Dict:
     try:
         logger.info("\n=== Starting Career Analysis ===")
         
-        # Initialize Groq client
-        client = groq.Groq(
-            api_key=os.getenv("GROQ_API_KEY")
-        )
-        logger.info("Groq client initialized")
-
         # Format the prompt
         prompt = f"""Analyze this resume and provide career guidance:
         
@@ -120,8 +121,7 @@ async def analyze_career(resume_text: str) -> Dict:
 
         for attempt in range(max_retries):
             try:
-                # Groq API call is synchronous, no need for await
-                completion = client.chat.completions.create(
+                completion = await _GROQ_CLIENT.chat.completions.create(
                     model="meta-llama/llama-4-maverick-17b-128e-instruct",
                     messages=[
                         {
@@ -152,7 +152,8 @@ async def analyze_career(resume_text: str) -> Dict:
                     
                     # Generate PDF report
                     try:
-                        pdf_base64 = generate_pdf(analysis)
+                        # pdfkit shells out to wkhtmltopdf, so render off the event loop
+                        pdf_base64 = await asyncio.to_thread(generate_pdf, analysis)
                         if pdf_base64:
                             return {
                                 "status": "success",
@@ -40,7 +40,6 @@ application while maintaining professional standards and formatting.
 import os
 import groq
 from typing import Dict, Optional
-import PyPDF2
 from fastapi import HTTPException
 from pydantic import BaseModel
 from reportlab.lib.pagesizes import letter
@@ -144,29 +143,6 @@ def create_pdf_cover_letter(cover_letter_data: Dict) -> BytesIO:
     buffer.seek(0)
     return buffer
 
-def extract_text_from_pdf(pdf_file) -> str:
-    """
-    Extract text content from a PDF file.
-    
-    Args:
-        pdf_file: The uploaded PDF file
-        
-    Returns:
-        str: Extracted text from the PDF
-        
-    Raises:
-        HTTPException: If there's an error processing the PDF
-    """
-    try:
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
-    except Exception as e:
-        print(f"Error in extract_text_from_pdf: {str(e)}")
-        raise HTTPException(status_code=400, detail=f"Error processing PDF: {str(e)}")
-
 def generate_cover_letter(input_data: CoverLetterInput) -> Dict:
     """
     Generate a personalized cover letter using the Groq LLM API.
@@ -0,0 +1,124 @@
+"""
+Groq Batch API Helpers
+--------------------
+Shared helpers for submitting chat completion requests through Groq's Batch API.
+
+Batch jobs are billed at a discount and do not count against the per-minute rate
+limits, which makes them a better fit for bulk, non-interactive workloads. Each
+request body is written as one JSONL line, uploaded with purpose="batch", and the
+output file is mapped back to the caller's request order via the custom_id.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+import groq
+import orjson
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+# Batch statuses after which no more progress will be made
+FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+async def submit_batch(client: groq.AsyncGroq, bodies: List[Dict], completion_window: str = "24h") -> str:
+    """
+    Upload the request bodies as a JSONL file and start a batch job.
+
+    Args:
+        client (groq.AsyncGroq): Groq API client
+        bodies (List[Dict]): Chat completion request bodies, in caller order
+        completion_window (str): How long Groq may take to finish the batch
+
+    Returns:
+        str: The batch ID. The number of requests is stored in the batch metadata
+        under "request_count", see batch_request_count
+    """
+    lines = [
+        orjson.dumps({"custom_id": f"req-{i}", "method": "POST", "url": BATCH_ENDPOINT, "body": body})
+        for i, body in enumerate(bodies)
+    ]
+    input_file = await client.files.create(file=("batch.jsonl", b"\n".join(lines)), purpose="batch")
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=completion_window,
+        metadata={"request_count": str(len(bodies))}
+    )
+    return batch.id
+
+def batch_request_count(batch, results: Dict[int, str]) -> int:
+    """
+    Return how many requests a batch was submitted with.
+
+    Uses Groq's request counts, then the count submit_batch stored in the batch
+    metadata. As a last resort the highest result index is used, which keeps every
+    returned result at its submission position but cannot see trailing failures.
+
+    Args:
+        batch: Batch object returned by client.batches.retrieve
+        results (Dict[int, str]): Results returned by fetch_batch_results
+
+    Returns:
+        int: Number of requests in the batch
+    """
+    if batch.request_counts and batch.request_counts.total:
+        return batch.request_counts.total
+    metadata = getattr(batch, "metadata", None) or {}
+    if "request_count" in metadata:
+        return int(metadata["request_count"])
+    return max(results) + 1 if results else 0
+
+async def fetch_batch_results(client: groq.AsyncGroq, batch) -> Dict[int, str]:
+    """
+    Download a finished batch's output and map it back to request indices.
+
+    Args:
+        client (groq.AsyncGroq): Groq API client
+        batch: Batch object returned by client.batches.retrieve
+
+    Returns:
+        Dict[int, str]: Message content per request index; failed requests are omitted
+    """
+    results = {}
+    if not batch.output_file_id:
+        return results
+
+    output = await client.files.content(batch.output_file_id)
+    for line in (await output.read()).splitlines():
+        if not line.strip():
+            continue
+        item = orjson.loads(line)
+        response = item.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        index = int(item["custom_id"].split("-", 1)[1])
+        results[index] = response["body"]["choices"][0]["message"]["content"]
+    return results
+
+async def run_batch(client: groq.AsyncGroq, bodies: List[Dict], timeout: float,
+                    poll_interval: float = 30) -> Optional[Dict[int, str]]:
+    """
+    Submit a batch and poll until it finishes or the timeout expires.
+
+    Args:
+        client (groq.AsyncGroq): Groq API client
+        bodies (List[Dict]): Chat completion request bodies, in caller order
+        timeout (float): Seconds to wait before cancelling the batch
+        poll_interval (float): Seconds between status checks
+
+    Returns:
+        Optional[Dict[int, str]]: Message content per request index, or None if the
+        batch was cancelled because it did not finish in time
+    """
+    batch_id = await submit_batch(client, bodies)
+    deadline = time.monotonic() + timeout
+
+    while True:
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status in FINAL_STATUSES:
+            return await fetch_batch_results(client, batch)
+        if time.monotonic() >= deadline:
+            await client.batches.cancel(batch_id)
+            return None
+        await asyncio.sleep(poll_interval)
@@ -0,0 +1,29 @@
+"""
+Gunicorn Configuration
+--------------------
+Production process manager settings for the Resume AI API.
+
+Runs one Uvicorn worker per CPU so Groq-bound requests and CPU-bound PDF work
+are spread over several event loops instead of stalling a single one.
+
+Usage:
+    gunicorn -c gunicorn_conf.py main:app
+
+Note: interview sessions are kept in process memory (interview_coach.session_store),
+so set WEB_CONCURRENCY=1 if mock interviews must survive being routed to another worker.
+Background resume PDF and batch jobs (GET /pdf/{job_id}, GET /generate-resumes-batch/{job_id})
+are shared between workers through Redis; without REDIS_URL they are per-worker too,
+so multi-worker deployments need REDIS_URL set or WEB_CONCURRENCY=1.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+keepalive = 30
+
+# Each worker imports the app itself, so Groq clients, connection pools and
+# Jinja environments are created after the fork and never shared between workers
+preload_app = False
@@ -31,14 +31,11 @@ with a focus on providing constructive feedback and maintaining interview contex
 
 import os
 import uuid
-import PyPDF2
 import httpx
 from typing import Dict
 from fastapi import APIRouter, UploadFile, Form, File, HTTPException
-from tempfile import NamedTemporaryFile
 from dotenv import load_dotenv
-import groq
-from io import BytesIO
+from pdf_utils import extract_text_from_bytes_async
 
 load_dotenv()
 
@@ -50,20 +47,12 @@ GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 
 session_store: Dict[str, Dict] = {}
 
-client = groq.Groq(api_key=GROQ_API_KEY)
+# Shared HTTP client so interview turns reuse pooled keep-alive connections to Groq
+_http_client = httpx.AsyncClient(timeout=30.0)
 
-def extract_text_from_pdf(file_obj) -> str:
-    try:
-        # Reset file pointer to beginning
-        file_obj.seek(0)
-        pdf_reader = PyPDF2.PdfReader(file_obj)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
-    except Exception as e:
-        print(f"Error in extract_text_from_pdf: {str(e)}")
-        raise HTTPException(status_code=400, detail=f"Error processing PDF: {str(e)}")
+async def close_client() -> None:
+    """Close the shared HTTP client and its connection pool; called on app shutdown."""
+    await _http_client.aclose()
 
 def get_initial_prompt(resume: str, job_desc: str) -> str:
     return f"""
@@ -130,10 +119,9 @@ async def ask_groq(prompt: str) -> str:
             "temperature": 0.7,
             "max_tokens": 1024,
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.post(GROQ_API_URL, headers=headers, json=body)
-            response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"].strip()
+        response = await _http_client.post(GROQ_API_URL, headers=headers, json=body)
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"].strip()
     except Exception as e:
         print(f"Error in ask_groq: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error calling Groq API: {str(e)}")
@@ -154,13 +142,9 @@ async def start_interview(resume: UploadFile = File(...), job_description: str =
             print("Empty file uploaded")
             raise HTTPException(status_code=400, detail="Empty file uploaded")
             
-        # Create a BytesIO object from the file content
-        print("Creating BytesIO object...")
-        file_obj = BytesIO(contents)
-        
         # Extract text from PDF
         print("Extracting text from PDF...")
-        resume_text = extract_text_from_pdf(file_obj)
+        resume_text = await extract_text_from_bytes_async(contents)
         if not resume_text.strip():
             print("No text extracted from PDF")
             raise HTTPException(status_code=400, detail="Could not extract text from PDF")
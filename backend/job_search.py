@@ -4,11 +4,10 @@ from typing import Optional, List
 import httpx
 import os
 from dotenv import load_dotenv
-import PyPDF2
-import io
 import logging
 from pathlib import Path
 import re
+from pdf_utils import extract_text_from_bytes_async
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -78,25 +77,16 @@ class JobResult(BaseModel):
     match_score: float
     url: str
 
-async def extract_text_from_pdf(file_content: bytes) -> str:
-    """Extract text content from PDF file."""
-    try:
-        pdf_file = io.BytesIO(file_content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
-    except Exception as e:
-        logger.error(f"Error processing PDF: {str(e)}")
-        raise HTTPException(status_code=400, detail=f"Error processing PDF: {str(e)}")
+# Patterns used by clean_text, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,-]')
 
 def clean_text(text: str) -> str:
     """Clean text by removing special characters and extra whitespace."""
     # Replace newlines and multiple spaces with single space
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     # Remove special characters but keep basic punctuation
-    text = re.sub(r'[^\w\s.,-]', '', text)
+    text = _SPECIAL_CHARS_RE.sub('', text)
     return text.strip()
 
 def extract_keywords_from_resume(resume_text: str) -> dict:
@@ -305,7 +295,7 @@ async def search_jobs_by_resume(resume: UploadFile = File(...)):
         
         # Read and process the uploaded resume
         content = await resume.read()
-        resume_text = await extract_text_from_pdf(content)
+        resume_text = await extract_text_from_bytes_async(content)
         
         # Extract keywords and location from resume
         extracted_info = extract_keywords_from_resume(resume_text)
@@ -0,0 +1,182 @@
+"""
+LLM Response Cache
+----------------
+Exact-match cache for LLM responses, keyed by the model and the normalized inputs.
+
+Every cache implements the async LLMCache protocol. Entries are always kept in a
+bounded in-process cache, and when REDIS_URL is set they are also shared through
+Redis so hits survive restarts and are visible to every worker. Redis errors are
+logged and treated as misses, so an outage never fails a request.
+
+Hit and miss counts per cache are reported by cache_stats() for the /cache-stats
+endpoint.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from typing import Any, Dict, Optional, Protocol
+
+import orjson
+import redis
+import redis.asyncio
+from cachetools import LRUCache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Default time-to-live of a cached response, in seconds
+DEFAULT_TTL_SECONDS = 86400
+
+# Maximum number of responses kept in process memory per cache
+MEMORY_CACHE_SIZE = 1024
+
+class LLMCache(Protocol):
+    """Interface shared by all LLM response caches."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    async def set(self, key: str, value: Any, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+def make_cache_key(model: str, **inputs: str) -> str:
+    """
+    Build a cache key from the model name and the prompt inputs.
+
+    Inputs are stripped so that surrounding whitespace does not cause a miss.
+
+    Args:
+        model (str): Model the response was generated with
+        **inputs (str): Named prompt inputs
+
+    Returns:
+        str: SHA-256 hex digest identifying the request
+    """
+    payload = {"model": model}
+    payload.update({name: value.strip() for name, value in inputs.items()})
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+class MemoryLLMCache:
+    """Bounded in-process LRU cache with per-entry expiry."""
+
+    def __init__(self, maxsize: int = MEMORY_CACHE_SIZE):
+        self._entries = LRUCache(maxsize=maxsize)
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    async def close(self) -> None:
+        pass
+
+class RedisLLMCache:
+    """Redis-backed cache shared across workers; values are stored as JSON."""
+
+    def __init__(self, url: str, namespace: str):
+        self._redis = redis.asyncio.Redis.from_url(url)
+        self._prefix = f"llm:{namespace}:"
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            cached = await self._redis.get(self._prefix + key)
+        except redis.RedisError as e:
+            logger.warning("Redis cache unavailable: %s", e)
+            return None
+        return orjson.loads(cached) if cached is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+        try:
+            await self._redis.setex(self._prefix + key, ttl, orjson.dumps(value))
+        except redis.RedisError as e:
+            logger.warning("Redis cache unavailable: %s", e)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+class TieredLLMCache:
+    """
+    In-process cache in front of an optional shared cache, with hit/miss counters.
+
+    Shared-cache hits are copied into the in-process cache so repeat lookups in
+    the same worker skip the network round trip.
+    """
+
+    def __init__(self, memory: MemoryLLMCache, shared: Optional[LLMCache] = None):
+        self._memory = memory
+        self._shared = shared
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = await self._memory.get(key)
+        if value is None and self._shared is not None:
+            value = await self._shared.get(key)
+            if value is not None:
+                await self._memory.set(key, value)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+        await self._memory.set(key, value, ttl)
+        if self._shared is not None:
+            await self._shared.set(key, value, ttl)
+
+    async def close(self) -> None:
+        await self._memory.close()
+        if self._shared is not None:
+            await self._shared.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the hit/miss counters and which backends are in use."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "backend": "memory+redis" if self._shared is not None else "memory"
+        }
+
+# Caches created in this process, by namespace
+_caches: Dict[str, TieredLLMCache] = {}
+
+def create_llm_cache(namespace: str) -> TieredLLMCache:
+    """
+    Create the response cache for one kind of LLM call.
+
+    Args:
+        namespace (str): Name of the call, used as the Redis key prefix and in cache_stats()
+
+    Returns:
+        TieredLLMCache: In-process cache, backed by Redis when REDIS_URL is set
+    """
+    url = os.getenv("REDIS_URL")
+    cache = TieredLLMCache(MemoryLLMCache(), RedisLLMCache(url, namespace) if url else None)
+    _caches[namespace] = cache
+    return cache
+
+async def close_llm_caches() -> None:
+    """Close the connections of every cache created in this process; called on app shutdown."""
+    for cache in _caches.values():
+        await cache.close()
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Return the statistics of every cache created in this process, by namespace."""
+    return {namespace: cache.stats() for namespace, cache in _caches.items()}
@@ -17,6 +17,7 @@ The router integrates with various core modules:
 - portfolio_generator.py: Portfolio website generation
 - career_coach.py: Career guidance and analysis
 - interview_coach.py: Mock interview functionality
+- pdf_utils.py: Shared, cached PDF text extraction
 
 Each endpoint includes:
 - Input validation
@@ -27,33 +28,50 @@ Each endpoint includes:
 """
 
 import os
+import base64
+import asyncio
+import logging
+import orjson
+from typing import List
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Header
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from io import BytesIO
 
+# Load environment variables from .env file before importing the modules below,
+# which read GROQ_API_KEY, REDIS_URL and the cache settings at import time
+load_dotenv()
+
 # Import core logic from other files
-from resume_optimizer import extract_text_from_pdf, analyze_resume
-from resume_generator import ResumeData, generate_resume
+from resume_optimizer import analyze_resume, analyze_resumes, stream_analysis, submit_analysis_batch, get_analysis_batch, close_client as close_optimizer_client
+from resume_generator import ResumeData, ResumeGenerationError, generate_resume_json, render_pdf, start_pdf_job, get_pdf_job, start_resume_batch_job, get_resume_batch_job, close_client as close_generator_client
 from coverletter_writer import generate_cover_letter, CoverLetterInput
-from portfolio_generator import PortfolioData, generate_portfolio, extract_text_from_pdf as extract_portfolio_text
-from career_coach import analyze_career
-from interview_coach import start_interview, submit_answer
+from portfolio_generator import PortfolioData, PersonalInfo, generate_portfolio
+from career_coach import analyze_career, close_client as close_career_client
+from interview_coach import start_interview, submit_answer, close_client as close_interview_client
 from job_search import router as job_search_router
+from pdf_utils import extract_text_from_bytes_async, read_upload
+from llm_cache import cache_stats, close_llm_caches
 
-# Load environment variables from .env file
-load_dotenv()
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 # Verify API key is set
 if not os.getenv("GROQ_API_KEY"):
     raise ValueError("GROQ_API_KEY environment variable is not set. Please set it in your .env file.")
 
+# Most resumes accepted in one POST /generate-resumes-batch request
+MAX_BATCH_RESUMES = 100
+
 # Initialize FastAPI application
 app = FastAPI(
     title="Resume AI API",
     description="API for resume generation and optimization",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -68,13 +86,28 @@ app.add_middleware(
         "https://*.vercel.app"  # Allow all Vercel preview deployments
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Only what the frontend sends; Accept and Content-Type are always allowed by Starlette
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["content-type", "authorization", "accept"],
 )
 
+# Compress large JSON/HTML payloads (generated resumes and portfolios)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Include routers
 app.include_router(job_search_router)
 
+@app.on_event("shutdown")
+async def close_clients():
+    """Close the shared Groq, HTTP and Redis clients so pooled connections shut down cleanly."""
+    await asyncio.gather(
+        close_optimizer_client(),
+        close_generator_client(),
+        close_career_client(),
+        close_interview_client(),
+        close_llm_caches()
+    )
+
 @app.post("/analyze-resume")
 async def analyze_resume_endpoint(
     resume: UploadFile = File(description="Upload your resume in PDF format"),
@@ -87,44 +120,156 @@ async def analyze_resume_endpoint(
     - **job_description**: Paste the job description here
     """
     try:
-        print(f"Received resume file: {resume.filename}, content type: {resume.content_type}")
-        print(f"Job description length: {len(job_description)}")
+        logger.debug("Received resume file: %s, content type: %s", resume.filename, resume.content_type)
         
         if not resume.filename.lower().endswith('.pdf'):
             raise HTTPException(status_code=400, detail="Only PDF files are supported")
         
+        # Read the upload in chunks, rejecting oversized files before parsing
+        resume_bytes = await read_upload(resume)
+        
         # Extract text from resume
         try:
-            resume_text = extract_text_from_pdf(resume.file)
-            print(f"Extracted text length: {len(resume_text)}")
+            resume_text = await extract_text_from_bytes_async(resume_bytes)
+            logger.debug("Extracted text length: %d", len(resume_text))
             if not resume_text.strip():
                 raise HTTPException(status_code=400, detail="Could not extract text from the PDF file")
         except Exception as e:
-            print(f"Error extracting text from PDF: {str(e)}")
+            logger.error("Error extracting text from PDF: %s", e)
             raise HTTPException(status_code=400, detail=f"Error processing PDF file: {str(e)}")
         
         # Get analysis from API
         try:
-            analysis = analyze_resume(resume_text, job_description)
-            print("\n=== Final Response ===")
-            print("Analysis:", analysis)
+            analysis = await analyze_resume(resume_text, job_description)
             
             response = {
                 "status": "success",
                 "analysis": analysis
             }
-            print("Response:", response)
-            
-            return JSONResponse(content=response)
+            return ORJSONResponse(content=response)
         except Exception as e:
-            print(f"Error during analysis: {str(e)}")
+            logger.error("Error during analysis: %s", e)
             raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
     except HTTPException as he:
         raise he
     except Exception as e:
-        print(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
 
+@app.post("/analyze-resume/stream")
+async def analyze_resume_stream_endpoint(
+    resume: UploadFile = File(description="Upload your resume in PDF format"),
+    job_description: str = Form(description="Paste the job description here")
+):
+    """
+    Analyze a resume against a job description, streaming the output as Server-Sent Events.
+    
+    - **resume**: Upload your resume in PDF format
+    - **job_description**: Paste the job description here
+    
+    Emits `delta` events with generated text as it arrives, then one `result`
+    event with the same analysis object `/analyze-resume` returns, or an
+    `error` event if the analysis fails.
+    """
+    if not resume.filename.lower().endswith('.pdf'):
+        raise HTTPException(status_code=400, detail="Only PDF files are supported")
+    
+    resume_text = await extract_text_from_bytes_async(await read_upload(resume))
+    if not resume_text.strip():
+        raise HTTPException(status_code=400, detail="Could not extract text from the PDF file")
+    
+    return StreamingResponse(
+        stream_analysis(resume_text, job_description),
+        media_type="text/event-stream",
+        # An explicit encoding keeps GZipMiddleware from buffering the stream
+        headers={"Cache-Control": "no-cache", "Content-Encoding": "identity"}
+    )
+
+@app.post("/analyze-batch")
+async def analyze_batch_endpoint(
+    resumes: List[UploadFile] = File(description="Upload the resumes in PDF format"),
+    job_description: str = Form(description="Paste the job description here")
+):
+    """
+    Analyze several resumes against one job description.
+    
+    - **resumes**: Upload the resumes in PDF format
+    - **job_description**: Paste the job description here
+    
+    Resumes are analyzed together in as few LLM calls as fit, so the job
+    description is sent once instead of once per resume. Analyses are returned
+    in upload order.
+    """
+    if any(not resume.filename.lower().endswith('.pdf') for resume in resumes):
+        raise HTTPException(status_code=400, detail="Only PDF files are supported")
+    
+    resume_texts = []
+    for resume in resumes:
+        resume_text = await extract_text_from_bytes_async(await read_upload(resume))
+        if not resume_text.strip():
+            raise HTTPException(status_code=400, detail=f"Could not extract text from {resume.filename}")
+        resume_texts.append(resume_text)
+    
+    try:
+        analyses = await analyze_resumes(resume_texts, job_description)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error during batch analysis: %s", e)
+        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+    return ORJSONResponse(content={"status": "success", "analyses": analyses})
+
+@app.post("/analyze-resumes-batch")
+async def analyze_resumes_batch_endpoint(
+    resumes: List[UploadFile] = File(description="Upload the resumes in PDF format"),
+    job_descriptions: List[str] = Form(description="One job description for all resumes, or one per resume")
+):
+    """
+    Submit many resume analyses as an offline Groq batch job.
+    
+    - **resumes**: Upload the resumes in PDF format
+    - **job_descriptions**: One job description for all resumes, or one per resume
+    
+    Returns a batch ID; poll `GET /analyze-resumes-batch/{batch_id}` for the results.
+    Batches are cheaper than individual analyses but may take up to 24 hours.
+    """
+    if len(job_descriptions) not in (1, len(resumes)):
+        raise HTTPException(status_code=400, detail="Provide one job description, or one per resume")
+    if any(not resume.filename.lower().endswith('.pdf') for resume in resumes):
+        raise HTTPException(status_code=400, detail="Only PDF files are supported")
+    
+    if len(job_descriptions) == 1:
+        job_descriptions = job_descriptions * len(resumes)
+    
+    pairs = []
+    for resume, job_description in zip(resumes, job_descriptions):
+        resume_text = await extract_text_from_bytes_async(await read_upload(resume))
+        if not resume_text.strip():
+            raise HTTPException(status_code=400, detail=f"Could not extract text from {resume.filename}")
+        pairs.append((resume_text, job_description))
+    
+    try:
+        batch_id = await submit_analysis_batch(pairs)
+    except Exception as e:
+        logger.error("Error submitting analysis batch: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to submit batch: {str(e)}")
+    return ORJSONResponse(content={"status": "submitted", "batch_id": batch_id})
+
+@app.get("/analyze-resumes-batch/{batch_id}")
+async def get_analyze_resumes_batch(batch_id: str):
+    """
+    Poll a batch of resume analyses.
+    
+    - **batch_id**: The ID returned by `POST /analyze-resumes-batch`
+    
+    Returns the batch status, plus the analyses in upload order once the batch has finished.
+    """
+    try:
+        return ORJSONResponse(content=await get_analysis_batch(batch_id))
+    except Exception as e:
+        logger.error("Error fetching analysis batch: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to fetch batch: {str(e)}")
+
 @app.post("/generate-resume")
 async def generate_resume_endpoint(resume_data: ResumeData, accept: str = Header(default="application/pdf")):
     """
@@ -132,30 +277,38 @@ async def generate_resume_endpoint(resume_data: ResumeData, accept: str = Header
     
     - **resume_data**: The structured resume data
     - **accept**: The Accept header to determine response format (application/pdf or application/json)
+    
+    JSON responses return as soon as the resume JSON and HTML are ready and carry a
+    `pdf_job_id`; the PDF renders in the background and is fetched from `GET /pdf/{job_id}`.
     """
     try:
         print("\n=== Resume Generation Request ===")
         print(f"Accept header: {accept}")
-        print("Resume data:", resume_data.dict())
+        print("Resume data:", resume_data.model_dump())
         
-        result = generate_resume(resume_data)
+        result = await generate_resume_json(resume_data)
         print("\n=== Generation Result ===")
         print(f"Status: {result['status']}")
         
         if result["status"] == "success":
             if "application/json" in accept:
                 print("Returning JSON response")
-                return JSONResponse(content=result)
+                return ORJSONResponse(content={**result, "pdf_job_id": await start_pdf_job(result["html"])})
             else:
                 print("Returning PDF response")
+                pdf_base64 = await render_pdf(result["html"])
                 return StreamingResponse(
-                    BytesIO(result["pdf"]),
+                    BytesIO(base64.b64decode(pdf_base64)),
                     media_type="application/pdf",
                     headers={
                         "Content-Disposition": f"attachment; filename={result['resume']['name'].lower().replace(' ', '-')}-resume.pdf"
                     }
                 )
         return result
+    except ResumeGenerationError as ge:
+        # Groq or its output failed, not the request
+        logger.error("Resume generation failed: %s", ge)
+        raise HTTPException(status_code=502, detail=str(ge))
     except ValueError as ve:
         print(f"\n=== Validation Error ===")
         print(f"Error: {str(ve)}")
@@ -165,6 +318,68 @@ async def generate_resume_endpoint(resume_data: ResumeData, accept: str = Header
         print(f"Error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to generate resume: {str(e)}")
 
+@app.get("/cache-stats")
+async def get_cache_stats():
+    """
+    Report hit/miss counters of the LLM response caches in this worker.
+    """
+    return ORJSONResponse(content=cache_stats())
+
+@app.get("/pdf/{job_id}")
+async def get_resume_pdf(job_id: str):
+    """
+    Poll a background resume PDF job.
+    
+    - **job_id**: The `pdf_job_id` returned by `/generate-resume`
+    
+    Returns 202 while the PDF is still rendering and the base64 encoded PDF once ready.
+    """
+    job = await get_pdf_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="PDF job not found")
+    if job["status"] == "pending":
+        return ORJSONResponse(status_code=202, content=job)
+    if job["status"] == "error":
+        raise HTTPException(status_code=500, detail=f"Failed to render PDF: {job['detail']}")
+    return ORJSONResponse(content=job)
+
+@app.post("/generate-resumes-batch")
+async def generate_resumes_batch_endpoint(items: List[ResumeData]):
+    """
+    Generate many resumes as a background job through the Groq Batch API.
+    
+    - **items**: The structured resume data, one entry per resume
+    
+    Returns a job ID; poll `GET /generate-resumes-batch/{job_id}` for the results.
+    Batches are cheaper than individual generations but may take up to 15 minutes
+    before falling back to regular requests.
+    """
+    if not items:
+        raise HTTPException(status_code=400, detail="Provide at least one resume")
+    if len(items) > MAX_BATCH_RESUMES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_RESUMES} resumes per batch")
+    job_id = await start_resume_batch_job(items)
+    return ORJSONResponse(status_code=202, content={"status": "submitted", "job_id": job_id})
+
+@app.get("/generate-resumes-batch/{job_id}")
+async def get_resumes_batch(job_id: str):
+    """
+    Poll a background batch resume generation job.
+    
+    - **job_id**: The ID returned by `POST /generate-resumes-batch`
+    
+    Returns 202 while the batch is running, then one result per submitted resume in
+    submission order; resumes that failed have status "error".
+    """
+    job = await get_resume_batch_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Batch job not found")
+    if job["status"] == "pending":
+        return ORJSONResponse(status_code=202, content=job)
+    if job["status"] == "error":
+        raise HTTPException(status_code=500, detail=f"Batch generation failed: {job['detail']}")
+    return ORJSONResponse(content=job)
+
 @app.post("/api/generate-cover-letter")
 async def generate_cover_letter_endpoint(
     company_name: str = Form(...),
@@ -189,11 +404,12 @@ async def generate_cover_letter_endpoint(
         if not resume.filename.lower().endswith('.pdf'):
             raise HTTPException(status_code=400, detail="Only PDF files are allowed")
         
-        # Extract text from resume
-        resume_text = extract_text_from_pdf(resume.file)
+        # Extract text from resume, rejecting empty, non-PDF and oversized uploads first
+        resume_text = await extract_text_from_bytes_async(await read_upload(resume))
         
         # Generate cover letter
-        result = generate_cover_letter(CoverLetterInput(
+        # Cover letter generation calls Groq and builds the PDF synchronously, so run it in a thread
+        result = await asyncio.to_thread(generate_cover_letter, CoverLetterInput(
             company_name=company_name,
             position_title=position_title,
             job_description=job_description,
@@ -209,6 +425,8 @@ async def generate_cover_letter_endpoint(
             }
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error in generate_cover_letter_endpoint: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -233,7 +451,7 @@ async def generate_portfolio_endpoint(
         style (str): Portfolio style ('minimal', 'creative', or 'professional')
         
     Returns:
-        JSONResponse: Generated portfolio HTML
+        ORJSONResponse: Generated portfolio HTML
     """
     try:
         print("\n=== Portfolio Generation Request ===")
@@ -245,6 +463,8 @@ async def generate_portfolio_endpoint(
         if style not in valid_styles:
             raise HTTPException(status_code=400, detail=f"Invalid style. Must be one of: {', '.join(valid_styles)}")
 
+        # Raw resume text, only for uploads; the LLM fills the portfolio in from it
+        resume_text = None
         if method == "upload":
             if not resume:
                 raise HTTPException(status_code=400, detail="Resume file is required for upload method")
@@ -253,10 +473,10 @@ async def generate_portfolio_endpoint(
             if not resume.filename.lower().endswith('.pdf'):
                 raise HTTPException(status_code=400, detail="Only PDF files are allowed")
             
-            # Extract text from resume
-            resume_text = extract_portfolio_text(resume.file)
+            # Extract text from resume, rejecting empty, non-PDF and oversized uploads first
+            resume_text = await extract_text_from_bytes_async(await read_upload(resume))
             
-            # Create a basic PortfolioData structure from the resume text
+            # Empty PortfolioData; the details are extracted from resume_text
             portfolio_data = PortfolioData(
                 personal_info=PersonalInfo(
                     full_name="",  # Will be extracted from resume
@@ -277,13 +497,11 @@ async def generate_portfolio_endpoint(
                 raise HTTPException(status_code=400, detail="Portfolio data is required for guided method")
             
             # Parse the portfolio data
-            import json
             try:
                 print("\n=== Parsing Portfolio Data ===")
-                print(f"Raw data: {portfolio_data}")
+                logger.debug("Raw data: %s", portfolio_data)
                 
-                data = json.loads(portfolio_data)
-                print(f"Parsed data: {json.dumps(data, indent=2)}")
+                data = orjson.loads(portfolio_data)
                 
                 # Validate required fields
                 required_fields = ["personal_info", "experience", "education", "technical_skills", "soft_skills", "projects"]
@@ -302,14 +520,14 @@ async def generate_portfolio_endpoint(
                 # Create PortfolioData instance
                 try:
                     portfolio_data = PortfolioData(**data)
-                    print("\n=== Validated Portfolio Data ===")
-                    print(json.dumps(portfolio_data.dict(), indent=2))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Validated portfolio data: %s", orjson.dumps(portfolio_data.model_dump(), option=orjson.OPT_INDENT_2).decode())
                 except Exception as e:
                     print(f"\n=== Portfolio Data Validation Error ===")
                     print(f"Error: {str(e)}")
                     raise ValueError(f"Invalid portfolio data structure: {str(e)}")
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 print(f"\n=== JSON Parse Error ===")
                 print(f"Error: {str(e)}")
                 print(f"Invalid JSON: {portfolio_data}")
@@ -323,8 +541,8 @@ async def generate_portfolio_endpoint(
         
         # Generate portfolio with selected style
         try:
-            result = generate_portfolio(portfolio_data, style)
-            return JSONResponse(content=result)
+            result = await asyncio.to_thread(generate_portfolio, portfolio_data, style, resume_text=resume_text)
+            return ORJSONResponse(content=result)
         except Exception as e:
             print(f"\n=== Portfolio Generation Error ===")
             print(f"Error: {str(e)}")
@@ -340,6 +558,73 @@ async def generate_portfolio_endpoint(
         if resume:
             await resume.close()
 
+@app.post("/api/analyze-and-portfolio")
+async def analyze_and_portfolio_endpoint(
+    resume: UploadFile = File(description="Upload your resume in PDF format"),
+    job_description: str = Form(description="Paste the job description here"),
+    style: str = Form("professional")
+):
+    """
+    Analyze a resume and generate a portfolio website from it in one request.
+    
+    Both Groq calls run concurrently, so the request takes as long as the slower
+    of the two instead of their sum.
+    
+    - **resume**: Upload your resume in PDF format
+    - **job_description**: Paste the job description here
+    - **style**: Portfolio style ('minimal', 'creative', or 'professional')
+    """
+    try:
+        print("\n=== Analyze and Portfolio Request ===")
+        print(f"Received resume file: {resume.filename}, style: {style}")
+        
+        valid_styles = ['minimal', 'creative', 'professional']
+        if style not in valid_styles:
+            raise HTTPException(status_code=400, detail=f"Invalid style. Must be one of: {', '.join(valid_styles)}")
+        
+        if not resume.filename.lower().endswith('.pdf'):
+            raise HTTPException(status_code=400, detail="Only PDF files are supported")
+        
+        # Extract text once and share it between both generators
+        resume_text = await extract_text_from_bytes_async(await read_upload(resume))
+        if not resume_text.strip():
+            raise HTTPException(status_code=400, detail="Could not extract text from the PDF file")
+        
+        # The portfolio details are taken from the resume text by the LLM
+        portfolio_data = PortfolioData(
+            personal_info=PersonalInfo(
+                full_name="",
+                email="",
+                phone="",
+                location="",
+                summary=""
+            ),
+            experience=[],
+            education=[],
+            technical_skills="",
+            soft_skills="",
+            projects=[]
+        )
+        
+        analysis, portfolio = await asyncio.gather(
+            analyze_resume(resume_text, job_description),
+            asyncio.to_thread(generate_portfolio, portfolio_data, style, resume_text=resume_text)
+        )
+        
+        return ORJSONResponse(content={
+            "status": "success",
+            "analysis": analysis,
+            "portfolio": portfolio["portfolio"]
+        })
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        print(f"\n=== Unexpected Error ===")
+        print(f"Error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
+    finally:
+        await resume.close()
+
 @app.post("/analyze-career")
 async def analyze_career_endpoint(resume: UploadFile = File(description="Upload your resume in PDF format")):
     """
@@ -359,25 +644,20 @@ async def analyze_career_endpoint(resume: UploadFile = File(description="Upload
         # Read file content
         try:
             print("\n=== Reading File Content ===")
-            file_content = await resume.read()
+            # Rejects empty, non-PDF and oversized uploads before parsing
+            file_content = await read_upload(resume)
             print(f"File size: {len(file_content)} bytes")
             
-            if len(file_content) == 0:
-                print("Empty file received")
-                raise HTTPException(status_code=400, detail="Empty file received")
-            
-            # Create a BytesIO object for text extraction
-            from io import BytesIO
-            resume.file = BytesIO(file_content)
-            
             print("\n=== Extracting Text from PDF ===")
-            resume_text = extract_text_from_pdf(resume.file)
+            resume_text = await extract_text_from_bytes_async(file_content)
             print(f"Extracted text length: {len(resume_text)}")
             
             if not resume_text.strip():
                 print("No text extracted from PDF")
                 raise HTTPException(status_code=400, detail="Could not extract text from the PDF file")
                 
+        except HTTPException:
+            raise
         except Exception as e:
             print(f"\n=== PDF Processing Error ===")
             print(f"Error: {str(e)}")
@@ -390,7 +670,7 @@ async def analyze_career_endpoint(resume: UploadFile = File(description="Upload
             print("\n=== Career Analysis Complete ===")
             print("Analysis status:", result.get("status"))
             
-            return JSONResponse(content=result)
+            return ORJSONResponse(content=result)
         except Exception as e:
             print(f"\n=== Career Analysis Error ===")
             print(f"Error: {str(e)}")
@@ -427,7 +707,7 @@ async def start_interview_endpoint(
         
         # Start interview
         result = await start_interview(resume, job_description)
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException as he:
         raise he
@@ -456,7 +736,7 @@ async def submit_answer_endpoint(
         
         # Process answer
         result = await submit_answer(session_id=session_id, answer=answer)
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException as he:
         raise he
@@ -472,15 +752,23 @@ async def root():
         "message": "Welcome to Resume AI API",
         "endpoints": {
             "analyze_resume": "POST /analyze-resume - Analyze a resume against a job description",
+            "analyze_resume_stream": "POST /analyze-resume/stream - Analyze a resume, streaming the output as Server-Sent Events",
+            "analyze_batch": "POST /analyze-batch - Analyze several resumes against one job description",
+            "analyze_resumes_batch": "POST /analyze-resumes-batch - Analyze many resumes as an offline batch",
             "generate_resume": "POST /generate-resume - Generate a professional resume",
+            "generate_resumes_batch": "POST /generate-resumes-batch - Generate many resumes as a background batch job",
+            "resume_pdf": "GET /pdf/{job_id} - Fetch the PDF of a generated resume",
+            "cache_stats": "GET /cache-stats - LLM response cache hit/miss counters",
             "generate_cover_letter": "POST /api/generate-cover-letter - Generate a personalized cover letter",
-            "generate_portfolio": "POST /api/generate-portfolio - Generate a portfolio website"
+            "generate_portfolio": "POST /api/generate-portfolio - Generate a portfolio website",
+            "analyze_and_portfolio": "POST /api/analyze-and-portfolio - Analyze a resume and generate a portfolio in one request"
         },
         "usage": {
             "analyze_resume": "Upload a resume PDF and provide a job description for analysis",
             "generate_resume": "Provide resume data to generate a professional resume",
             "generate_cover_letter": "Upload a resume PDF and provide job details to generate a cover letter",
-            "generate_portfolio": "Upload a resume PDF or provide portfolio data to generate a website"
+            "generate_portfolio": "Upload a resume PDF or provide portfolio data to generate a website",
+            "analyze_and_portfolio": "Upload a resume PDF and provide a job description to get both results at once"
         }
     }
 
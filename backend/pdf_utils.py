@@ -0,0 +1,300 @@
+"""
+PDF Utilities
+-----------
+Shared PDF text extraction used by every endpoint that accepts a resume upload.
+
+Text is extracted with pypdfium2 (PDFium bindings), which parses content streams
+in native code. Extracted text is cached by the BLAKE2b-128 digest of the uploaded
+bytes, so the same resume uploaded repeatedly (for example against several job
+descriptions) is only parsed once. When PDF_TEXT_CACHE_PATH is set, extracted text
+is also stored in a SQLite file there, so the cache survives restarts.
+
+PDFium is not thread-safe, so all calls into it are serialized with a lock; the
+endpoints run extraction in worker threads and would otherwise race. Documents
+with more than PARALLEL_PAGE_THRESHOLD pages are instead split into page ranges
+that are extracted concurrently in a process pool, where each process has its
+own copy of PDFium. The pool has PDF_PROCESS_WORKERS processes; if a child dies,
+the pool is rebuilt and the document is extracted in-process instead.
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+import pypdfium2 as pdfium
+from cachetools import LRUCache
+from fastapi import HTTPException, UploadFile
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Largest upload accepted, and the size of each read from the upload stream
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Every PDF file starts with this header
+PDF_MAGIC = b"%PDF-"
+
+# Maximum number of extracted documents kept in memory
+PDF_TEXT_CACHE_SIZE = 512
+
+# Extracted text keyed by the BLAKE2b-128 digest of the PDF bytes
+_pdf_text_cache = LRUCache(maxsize=PDF_TEXT_CACHE_SIZE)
+_pdf_text_cache_lock = threading.Lock()
+
+# Optional on-disk copy of the cache, opened on first use; guarded by _pdf_text_cache_lock
+_pdf_text_db = None
+
+def _get_text_db() -> Optional[sqlite3.Connection]:
+    """Open the persistent text cache on first use; None when PDF_TEXT_CACHE_PATH is unset."""
+    global _pdf_text_db
+    path = os.getenv("PDF_TEXT_CACHE_PATH")
+    if _pdf_text_db is None and path:
+        _pdf_text_db = sqlite3.connect(path, check_same_thread=False)
+        _pdf_text_db.execute("CREATE TABLE IF NOT EXISTS pdf_text (digest BLOB PRIMARY KEY, text TEXT)")
+        _pdf_text_db.commit()
+    return _pdf_text_db
+
+# PDFium keeps global state and must not be called from several threads at once
+_pdfium_lock = threading.Lock()
+
+# Dedicated threads for reading, hashing and extracting uploads, so PDF work never
+# blocks the event loop or competes with other to_thread users for the default pool
+_pdf_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pdf")
+
+# Documents longer than this are extracted in parallel; shorter ones are not worth
+# the cost of shipping the bytes to other processes
+PARALLEL_PAGE_THRESHOLD = 4
+
+# Processes for long documents in each app worker. Every gunicorn worker has its own
+# pool, so by default the CPUs are divided between the WEB_CONCURRENCY workers, with
+# at least two so parallel extraction stays on under one worker per CPU. The pool is
+# only spawned when the first long document arrives. Set to 1 to disable it
+_cpu_count = os.cpu_count() or 1
+_web_workers = max(1, int(os.getenv("WEB_CONCURRENCY") or _cpu_count))
+PDF_PROCESS_WORKERS = max(1, int(os.getenv("PDF_PROCESS_WORKERS") or max(2, _cpu_count // _web_workers)))
+
+# Created on first use and replaced if a child process dies
+_page_pool = None
+_page_pool_lock = threading.Lock()
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """
+    Return the process pool for long documents, creating it on first use.
+
+    Processes are spawned rather than forked, so a child never inherits a PDFium or
+    lock state captured mid-call by another thread.
+    """
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            _page_pool = ProcessPoolExecutor(
+                max_workers=PDF_PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _page_pool
+
+def _reset_page_pool(broken: ProcessPoolExecutor) -> None:
+    """Discard a broken process pool so the next long document starts a fresh one."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is broken:
+            _page_pool = None
+    broken.shutdown(wait=False)
+
+async def read_upload(upload: UploadFile) -> bytes:
+    """
+    Read an uploaded PDF in chunks into a single buffer, validating it on the way.
+
+    Reading through UploadFile.read() keeps the spooled-file I/O off the event
+    loop. Empty files and files that do not start with the PDF magic bytes are
+    rejected after the first chunk, and oversized uploads before they are fully
+    buffered, so invalid input never reaches the parser.
+
+    Args:
+        upload (UploadFile): The uploaded file
+
+    Returns:
+        bytes: The file contents
+
+    Raises:
+        HTTPException: 400 if the file is empty or not a PDF, 413 if it is larger than MAX_UPLOAD_BYTES
+    """
+    buf = bytearray(await upload.read(UPLOAD_CHUNK_SIZE))
+    if not buf:
+        raise HTTPException(status_code=400, detail="Empty file uploaded")
+    if not buf.startswith(PDF_MAGIC):
+        raise HTTPException(status_code=400, detail="Not a valid PDF")
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        buf.extend(chunk)
+        if len(buf) > MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large; the maximum size is {MAX_UPLOAD_BYTES // (1024 * 1024)} MB"
+            )
+    return bytes(buf)
+
+def _extract_page_range(data: bytes, start: int, stop: int) -> List[str]:
+    """
+    Extract the text of pages [start, stop) of a PDF; runs in a pool process.
+
+    Args:
+        data (bytes): Raw PDF bytes
+        start (int): Index of the first page
+        stop (int): Index after the last page
+
+    Returns:
+        List[str]: Text of each page in the range
+    """
+    pdf = pdfium.PdfDocument(data)
+    try:
+        return [pdf[index].get_textpage().get_text_range() for index in range(start, stop)]
+    finally:
+        pdf.close()
+
+def _extract_parallel(data: bytes, page_count: int) -> str:
+    """
+    Extract the text of a long PDF by splitting its pages across the process pool.
+
+    Args:
+        data (bytes): Raw PDF bytes
+        page_count (int): Number of pages in the document
+
+    Returns:
+        str: Extracted text from the PDF
+
+    Raises:
+        BrokenProcessPool: If a pool process died; the pool has been discarded
+    """
+    pool = _get_page_pool()
+    step = -(-page_count // PDF_PROCESS_WORKERS)
+    try:
+        futures = [
+            pool.submit(_extract_page_range, data, start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        return "\n".join([text for future in futures for text in future.result()])
+    except BrokenProcessPool:
+        _reset_page_pool(pool)
+        raise
+
+def _extract_cached(key: bytes, data: bytes) -> str:
+    """
+    Return the text for a PDF, parsing it only on a cache miss.
+
+    Args:
+        key (bytes): BLAKE2b-128 digest of the PDF bytes
+        data (bytes): Raw PDF bytes
+
+    Returns:
+        str: Extracted text from the PDF
+    """
+    with _pdf_text_cache_lock:
+        text = _pdf_text_cache.get(key)
+        if text is None and _get_text_db() is not None:
+            row = _pdf_text_db.execute("SELECT text FROM pdf_text WHERE digest = ?", (key,)).fetchone()
+            if row is not None:
+                text = _pdf_text_cache[key] = row[0]
+    if text is not None:
+        return text
+
+    parallel = False
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(data)
+        try:
+            page_count = len(pdf)
+            parallel = page_count > PARALLEL_PAGE_THRESHOLD and PDF_PROCESS_WORKERS > 1
+            if not parallel:
+                text = "\n".join([page.get_textpage().get_text_range() for page in pdf])
+        finally:
+            pdf.close()
+    if parallel:
+        try:
+            text = _extract_parallel(data, page_count)
+        except BrokenProcessPool:
+            logger.warning("PDF process pool died, extracting %d pages in-process", page_count)
+            with _pdfium_lock:
+                pdf = pdfium.PdfDocument(data)
+                try:
+                    text = "\n".join([page.get_textpage().get_text_range() for page in pdf])
+                finally:
+                    pdf.close()
+
+    with _pdf_text_cache_lock:
+        _pdf_text_cache[key] = text
+        if _get_text_db() is not None:
+            _pdf_text_db.execute("INSERT OR REPLACE INTO pdf_text (digest, text) VALUES (?, ?)", (key, text))
+            _pdf_text_db.commit()
+    return text
+
+def extract_text_from_bytes(data: bytes) -> str:
+    """
+    Extract text content from raw PDF bytes.
+
+    Args:
+        data (bytes): Raw PDF bytes
+
+    Returns:
+        str: Extracted text from the PDF
+
+    Raises:
+        HTTPException: If there's an error processing the PDF
+    """
+    try:
+        return _extract_cached(hashlib.blake2b(data, digest_size=16).digest(), data)
+    except Exception as e:
+        logger.warning("Error in extract_text_from_bytes: %s", e)
+        raise HTTPException(status_code=400, detail=f"Error processing PDF: {str(e)}")
+
+def extract_text_from_pdf(pdf_file) -> str:
+    """
+    Extract text content from a PDF file.
+
+    Args:
+        pdf_file: The uploaded PDF file
+
+    Returns:
+        str: Extracted text from the PDF
+
+    Raises:
+        HTTPException: If there's an error processing the PDF
+    """
+    return extract_text_from_bytes(pdf_file.read())
+
+async def extract_text_from_bytes_async(data: bytes) -> str:
+    """
+    Extract text from raw PDF bytes on the PDF thread pool.
+
+    Args:
+        data (bytes): Raw PDF bytes
+
+    Returns:
+        str: Extracted text from the PDF
+
+    Raises:
+        HTTPException: If there's an error processing the PDF
+    """
+    return await asyncio.get_running_loop().run_in_executor(_pdf_pool, extract_text_from_bytes, data)
+
+async def extract_text_from_pdf_async(pdf_file) -> str:
+    """
+    Extract text from an uploaded PDF file on the PDF thread pool.
+
+    Args:
+        pdf_file: The uploaded PDF file
+
+    Returns:
+        str: Extracted text from the PDF
+
+    Raises:
+        HTTPException: If there's an error processing the PDF
+    """
+    return await asyncio.get_running_loop().run_in_executor(_pdf_pool, extract_text_from_pdf, pdf_file)
@@ -9,11 +9,14 @@ import os
 import groq
 from typing import Dict, List, Optional
 from pydantic import BaseModel, validator
-import PyPDF2
-from fastapi import HTTPException
 import re
-from jinja2 import Environment, FileSystemLoader
-import json
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+import orjson
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 # Pydantic models for data structure
 class Experience(BaseModel):
@@ -125,35 +128,21 @@ Use a clean, professional color scheme.
 Return the complete HTML code with embedded CSS.
 """
 
-def extract_text_from_pdf(pdf_file) -> str:
-    """
-    Extract text content from a PDF file.
-    
-    Args:
-        pdf_file: The uploaded PDF file
-        
-    Returns:
-        str: Extracted text from the PDF
-        
-    Raises:
-        HTTPException: If there's an error processing the PDF
-    """
-    try:
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
-    except Exception as e:
-        print(f"Error in extract_text_from_pdf: {str(e)}")
-        raise HTTPException(status_code=400, detail=f"Error processing PDF: {str(e)}")
+# Initialize Jinja2 environment
+template_dir = os.path.join(os.path.dirname(__file__), 'templates', 'portfolio')
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(template_dir),
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache()
+)
 
-def format_input_for_prompt(portfolio_data: PortfolioData) -> str:
+def format_input_for_prompt(portfolio_data: PortfolioData, resume_text: Optional[str] = None) -> str:
     """
     Format the input data into a structured prompt for the LLM.
     
     Args:
         portfolio_data (PortfolioData): The structured portfolio data from the user
+        resume_text (Optional[str]): Raw resume text to extract missing details from
         
     Returns:
         str: Formatted prompt string for the LLM
@@ -167,20 +156,17 @@ def format_input_for_prompt(portfolio_data: PortfolioData) -> str:
     exp_blocks = []
     for job in portfolio_data.experience:
         block = f"Position: {job.job_title}\nCompany: {job.company}\nPeriod: {job.start_date} - {job.end_date}\nLocation: {job.location}\n"
-        block += f"Description: {job.description}\n"
+        parts = [block, f"Description: {job.description}\n"]
         if job.achievements:
-            block += "Achievements:\n"
-            for a in job.achievements:
-                block += f"- {a}\n"
-        exp_blocks.append(block)
+            parts.append("Achievements:\n")
+            parts.extend(f"- {a}\n" for a in job.achievements)
+        exp_blocks.append("".join(parts))
 
     # Format education entries
     edu_blocks = []
     for edu in portfolio_data.education:
-        block = f"Degree: {edu.degree}\nInstitution: {edu.institution}\nGraduation: {edu.graduation_date}\nLocation: {edu.location}"
-        if edu.gpa:
-            block += f"\nGPA: {edu.gpa}"
-        edu_blocks.append(block)
+        gpa = f"\nGPA: {edu.gpa}" if edu.gpa else ""
+        edu_blocks.append(f"Degree: {edu.degree}\nInstitution: {edu.institution}\nGraduation: {edu.graduation_date}\nLocation: {edu.location}{gpa}")
 
     # Format project entries
     project_blocks = []
@@ -192,6 +178,9 @@ def format_input_for_prompt(portfolio_data: PortfolioData) -> str:
     technical_skills = [skill.strip() for skill in portfolio_data.technical_skills.split(',') if skill.strip()]
     soft_skills = [skill.strip() for skill in portfolio_data.soft_skills.split(',') if skill.strip()]
 
+    # Include the raw resume so the LLM can fill in anything the structured data lacks
+    resume_section = f"\n    ## Resume Text:\n    {resume_text}\n" if resume_text else ""
+
     # Return formatted prompt
     return f"""
     Generate a professional portfolio website based on the following information:
@@ -217,56 +206,105 @@ def format_input_for_prompt(portfolio_data: PortfolioData) -> str:
 
     ## Projects:
     {chr(10).join(project_blocks)}
+    {resume_section}"""
+
+def _portfoliodata_to_json(portfolio_data: PortfolioData) -> Dict:
+    """
+    Map portfolio data directly onto the template structure without calling the LLM.
+    
+    Mirrors the JSON structure requested from Groq in _generate_portfolio_json, so the
+    result can be rendered by any portfolio template.
+    
+    Args:
+        portfolio_data (PortfolioData): The structured portfolio data from the user
+        
+    Returns:
+        dict: Portfolio data in the template structure
     """
+    personal_info = portfolio_data.personal_info
+    return {
+        "personal_info": {
+            "name": personal_info.full_name,
+            # Use the most recent position as the professional title
+            "title": portfolio_data.experience[0].job_title if portfolio_data.experience else "",
+            "email": personal_info.email,
+            "phone": personal_info.phone,
+            "location": personal_info.location,
+            "linkedin": personal_info.linkedin or "",
+            "website": personal_info.website or "",
+            "summary": personal_info.summary
+        },
+        "experience": [
+            {
+                "title": job.job_title,
+                "company": job.company,
+                "period": f"{job.start_date} - {job.end_date}",
+                "location": job.location,
+                "description": job.description,
+                "achievements": [a.strip() for a in job.achievements if a.strip()]
+            }
+            for job in portfolio_data.experience
+        ],
+        "education": [
+            {
+                "degree": edu.degree,
+                "institution": edu.institution,
+                "period": edu.graduation_date,
+                "location": edu.location,
+                "gpa": edu.gpa or ""
+            }
+            for edu in portfolio_data.education
+        ],
+        "skills": {
+            "technical": [skill.strip() for skill in portfolio_data.technical_skills.split(',') if skill.strip()],
+            "soft": [skill.strip() for skill in portfolio_data.soft_skills.split(',') if skill.strip()]
+        },
+        "projects": [
+            {
+                "title": p.title,
+                "description": p.description
+            }
+            for p in portfolio_data.projects
+        ]
+    }
 
-def generate_portfolio(portfolio_data: PortfolioData, style: str = 'professional'):
+def _generate_portfolio_json(portfolio_data: PortfolioData, resume_text: Optional[str] = None) -> Dict:
     """
-    Generate a professional portfolio website using the Groq LLM API and Jinja2 templates.
+    Ask the Groq LLM to rewrite the portfolio data into the template structure.
     
     Args:
         portfolio_data (PortfolioData): The structured portfolio data from the user
-        style (str): The portfolio style ('minimal', 'creative', or 'professional')
+        resume_text (Optional[str]): Raw resume text to extract missing details from
         
     Returns:
-        dict: Generated portfolio HTML and assets
+        dict: Portfolio data in the template structure
         
     Raises:
-        Exception: If there's an error in portfolio generation
+        ValueError: If the Groq API call fails or returns an invalid structure
     """
+    # Initialize Groq client
+    client = groq.Groq(
+        api_key=os.getenv("GROQ_API_KEY")
+    )
+    
+    # Debug log for model verification
+    print("\n=== Model Configuration ===")
+    target_model = "meta-llama/llama-4-maverick-17b-128e-instruct"
+    print(f"Attempting to use model: {target_model}")
+    
+    # Format and send prompt to Groq
+    prompt = format_input_for_prompt(portfolio_data, resume_text)
+    print("\n=== Prompt to Groq ===")
+    print(prompt)
+    
     try:
-        print("\n" + "="*50)
-        print("STARTING PORTFOLIO GENERATION")
-        print("="*50)
-        
-        # Log input data
-        print("\n=== Input Data ===")
-        print(f"Style: {style}")
-        print("Portfolio Data:")
-        print(json.dumps(portfolio_data.dict(), indent=2))
-        
-        # Initialize Groq client
-        client = groq.Groq(
-            api_key=os.getenv("GROQ_API_KEY")
-        )
-        
-        # Debug log for model verification
-        print("\n=== Model Configuration ===")
-        target_model = "meta-llama/llama-4-maverick-17b-128e-instruct"
-        print(f"Attempting to use model: {target_model}")
-        
-        # Format and send prompt to Groq
-        prompt = format_input_for_prompt(portfolio_data)
-        print("\n=== Prompt to Groq ===")
-        print(prompt)
-        
-        try:
-            # Get completion from Groq
-            completion = client.chat.completions.create(
-                model=target_model,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": """You are a portfolio website generation expert. Your task is to generate a structured JSON 
+        # Get completion from Groq
+        completion = client.chat.completions.create(
+            model=target_model,
+            messages=[
+                {
+                    "role": "system", 
+                    "content": """You are a portfolio website generation expert. Your task is to generate a structured JSON 
                         representation of a portfolio website based on the user's input.
                         
                         Return a JSON object with the following structure:
@@ -323,105 +361,129 @@ def generate_portfolio(portfolio_data: PortfolioData, style: str = 'professional
                         8. Preserve all experience and education entries exactly as provided
                         9. Convert comma-separated skills into arrays
                         10. Maintain the exact structure of achievements and projects"""
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,  # Lower temperature for more consistent output
-                max_tokens=2000
-            )
-            
-            # Process the response
-            if not hasattr(completion, 'choices') or not completion.choices:
-                raise ValueError("No choices in Groq API response")
-                
-            if not hasattr(completion.choices[0], 'message'):
-                raise ValueError("No message in Groq API response choice")
-                
-            if not hasattr(completion.choices[0].message, 'content'):
-                raise ValueError("No content in Groq API response message")
-            
-            output_text = completion.choices[0].message.content.strip()
-            print("\n=== Raw Response from Groq ===")
-            print(output_text)
-            
-            if not output_text:
-                raise ValueError("Empty response received from Groq API")
-            
-            # Clean the response if it contains markdown code blocks
-            if "```json" in output_text:
-                output_text = output_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in output_text:
-                output_text = output_text.split("```")[1].split("```")[0].strip()
-            
-            print("\n=== Cleaned Response ===")
-            print(output_text)
-            
-            # Parse the JSON response
-            try:
-                portfolio_json = json.loads(output_text)
-                print("\n=== Parsed JSON ===")
-                print(json.dumps(portfolio_json, indent=2))
-            except json.JSONDecodeError as e:
-                print(f"\n=== JSON Parse Error ===")
-                print(f"Error: {str(e)}")
-                print(f"Invalid JSON: {output_text}")
-                raise ValueError(f"Failed to parse JSON response: {str(e)}")
-            
-            # Ensure all required fields are present
-            required_fields = ["personal_info", "experience", "education", "skills", "projects"]
-            missing_fields = [field for field in required_fields if field not in portfolio_json]
-            if missing_fields:
-                raise ValueError(f"Missing required fields in response: {', '.join(missing_fields)}")
-            
-            # Ensure arrays are properly formatted
-            if not isinstance(portfolio_json["experience"], list):
-                portfolio_json["experience"] = [portfolio_json["experience"]]
-            if not isinstance(portfolio_json["education"], list):
-                portfolio_json["education"] = [portfolio_json["education"]]
-            if not isinstance(portfolio_json["projects"], list):
-                portfolio_json["projects"] = [portfolio_json["projects"]]
-            
-            # Ensure skills are properly formatted
-            if not isinstance(portfolio_json["skills"], dict):
-                portfolio_json["skills"] = {"technical": [], "soft": []}
-            if not isinstance(portfolio_json["skills"].get("technical", []), list):
-                portfolio_json["skills"]["technical"] = [portfolio_json["skills"]["technical"]]
-            if not isinstance(portfolio_json["skills"].get("soft", []), list):
-                portfolio_json["skills"]["soft"] = [portfolio_json["skills"]["soft"]]
-            
-            # Ensure personal_info has all required fields
-            required_personal_info = ["name", "title", "email", "phone", "location", "summary"]
-            for field in required_personal_info:
-                if field not in portfolio_json["personal_info"]:
-                    portfolio_json["personal_info"][field] = ""
-            
-            print("\n=== Final Data Structure ===")
-            print(json.dumps(portfolio_json, indent=2))
-            
-            # Initialize Jinja2 environment
-            template_dir = os.path.join(os.path.dirname(__file__), 'templates', 'portfolio')
-            env = Environment(loader=FileSystemLoader(template_dir))
+                },
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3,  # Lower temperature for more consistent output
+            max_tokens=1200,
+            response_format={"type": "json_object"}  # Groq guarantees a syntactically valid JSON object
+        )
+        
+        # Process the response
+        if not hasattr(completion, 'choices') or not completion.choices:
+            raise ValueError("No choices in Groq API response")
             
-            # Select template based on style
-            template_name = f"{style.lower()}_template.html"
-            print(f"\n=== Using Template: {template_name} ===")
-            template = env.get_template(template_name)
+        if not hasattr(completion.choices[0], 'message'):
+            raise ValueError("No message in Groq API response choice")
             
-            # Render the template with the portfolio data
-            html_output = template.render(**portfolio_json)
+        if not hasattr(completion.choices[0].message, 'content'):
+            raise ValueError("No content in Groq API response message")
+        
+        output_text = completion.choices[0].message.content.strip()
+        print("\n=== Raw Response from Groq ===")
+        print(output_text)
+        
+        if not output_text:
+            raise ValueError("Empty response received from Groq API")
+        
+        # JSON mode returns a bare JSON object, so no markdown fence stripping is needed
+        portfolio_json = orjson.loads(output_text)
+        
+        # Ensure all required fields are present
+        required_fields = ["personal_info", "experience", "education", "skills", "projects"]
+        missing_fields = [field for field in required_fields if field not in portfolio_json]
+        if missing_fields:
+            raise ValueError(f"Missing required fields in response: {', '.join(missing_fields)}")
+        
+        # Ensure arrays are properly formatted
+        if not isinstance(portfolio_json["experience"], list):
+            portfolio_json["experience"] = [portfolio_json["experience"]]
+        if not isinstance(portfolio_json["education"], list):
+            portfolio_json["education"] = [portfolio_json["education"]]
+        if not isinstance(portfolio_json["projects"], list):
+            portfolio_json["projects"] = [portfolio_json["projects"]]
+        
+        # Ensure skills are properly formatted
+        if not isinstance(portfolio_json["skills"], dict):
+            portfolio_json["skills"] = {"technical": [], "soft": []}
+        if not isinstance(portfolio_json["skills"].get("technical", []), list):
+            portfolio_json["skills"]["technical"] = [portfolio_json["skills"]["technical"]]
+        if not isinstance(portfolio_json["skills"].get("soft", []), list):
+            portfolio_json["skills"]["soft"] = [portfolio_json["skills"]["soft"]]
+        
+        # Ensure personal_info has all required fields
+        required_personal_info = ["name", "title", "email", "phone", "location", "summary"]
+        for field in required_personal_info:
+            if field not in portfolio_json["personal_info"]:
+                portfolio_json["personal_info"][field] = ""
+        
+        return portfolio_json
             
-            return {
-                "status": "success",
-                "portfolio": {
-                    "html": html_output,
-                    "style": style
-                }
+    except Exception as e:
+        print(f"\n=== Groq API Error ===")
+        print(f"Error: {str(e)}")
+        raise ValueError(f"Groq API error: {str(e)}")
+
+def generate_portfolio(portfolio_data: PortfolioData, style: str = 'professional', use_llm: Optional[bool] = None,
+                       resume_text: Optional[str] = None):
+    """
+    Generate a professional portfolio website using the Groq LLM API and Jinja2 templates.
+    
+    The professional style maps the input fields straight onto its template, so it
+    skips the LLM round-trip unless use_llm is set explicitly or resume_text has to
+    be parsed.
+    
+    Args:
+        portfolio_data (PortfolioData): The structured portfolio data from the user
+        style (str): The portfolio style ('minimal', 'creative', or 'professional')
+        use_llm (Optional[bool]): Force (True) or skip (False) the LLM rewrite; defaults to
+            skipping it for the professional style only
+        resume_text (Optional[str]): Raw resume text to build the portfolio from
+        
+    Returns:
+        dict: Generated portfolio HTML and assets
+        
+    Raises:
+        Exception: If there's an error in portfolio generation
+    """
+    try:
+        print("\n" + "="*50)
+        print("STARTING PORTFOLIO GENERATION")
+        print("="*50)
+        
+        # Log input data
+        print("\n=== Input Data ===")
+        print(f"Style: {style}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Portfolio data: %s", orjson.dumps(portfolio_data.model_dump(), option=orjson.OPT_INDENT_2).decode())
+        
+        if use_llm is None:
+            use_llm = style.lower() != 'professional' or bool(resume_text)
+        
+        if use_llm:
+            portfolio_json = _generate_portfolio_json(portfolio_data, resume_text)
+        else:
+            print("\n=== Skipping Groq, mapping input directly ===")
+            portfolio_json = _portfoliodata_to_json(portfolio_data)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Final data structure: %s", orjson.dumps(portfolio_json, option=orjson.OPT_INDENT_2).decode())
+        
+        # Select template based on style
+        template_name = f"{style.lower()}_template.html"
+        print(f"\n=== Using Template: {template_name} ===")
+        template = _JINJA_ENV.get_template(template_name)
+        
+        # Render the template with the portfolio data
+        html_output = template.render(**portfolio_json)
+        
+        return {
+            "status": "success",
+            "portfolio": {
+                "html": html_output,
+                "style": style
             }
-                
-        except Exception as e:
-            print(f"\n=== Groq API Error ===")
-            print(f"Error: {str(e)}")
-            raise ValueError(f"Groq API error: {str(e)}")
+        }
             
     except Exception as e:
         print(f"\n=== Portfolio Generation Error ===")
@@ -32,24 +32,58 @@ This module handles the generation of professional resumes using AI. Key feature
    - Retry mechanisms
    - Detailed error logging
 
-The module uses Jinja2 for HTML templating and pdfkit for PDF generation,
+The module uses Jinja2 for HTML templating and WeasyPrint for PDF generation,
 ensuring professional and consistent output across different formats.
 """
 
 import os
 import groq
-from typing import Dict, List, Optional
-from pydantic import BaseModel
-from jinja2 import Environment, FileSystemLoader
-import json
-import pdfkit
-import tempfile
+from dotenv import load_dotenv
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+import orjson
+import fastjsonschema
+import logging
+from weasyprint import HTML, CSS
 import base64
-import time  # Add time module import
+import asyncio
+import hashlib
+import copy
+import random
+import string
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+from groq_batch import run_batch
+from semantic_cache import SemanticCache
+from llm_cache import RedisLLMCache
+
+load_dotenv()
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Shared client so every request reuses the same connection pool and TLS sessions
+_GROQ_CLIENT = groq.AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
+
+async def close_client() -> None:
+    """Close the shared Groq client, the PDF job store and their connections; called on app shutdown."""
+    await _GROQ_CLIENT.close()
+    if _pdf_store is not None:
+        await _pdf_store.close()
+    if _batch_store is not None:
+        await _batch_store.close()
+
+# Request models are read-only and silently drop unknown keys sent by the client
+_MODEL_CONFIG = ConfigDict(frozen=True, extra='ignore')
 
 # Pydantic models for data structure
 class Experience(BaseModel):
     """Model for work experience entries"""
+    model_config = _MODEL_CONFIG
+
     job_title: str
     company: str
     start_date: str
@@ -60,6 +94,8 @@ class Experience(BaseModel):
 
 class Education(BaseModel):
     """Model for education entries"""
+    model_config = _MODEL_CONFIG
+
     degree: str
     institution: str
     graduation_date: str
@@ -68,11 +104,15 @@ class Education(BaseModel):
 
 class Project(BaseModel):
     """Model for project entries"""
+    model_config = _MODEL_CONFIG
+
     title: str
     description: str
 
 class PersonalInfo(BaseModel):
     """Model for personal information"""
+    model_config = _MODEL_CONFIG
+
     full_name: str
     email: str
     phone: str
@@ -83,6 +123,8 @@ class PersonalInfo(BaseModel):
 
 class ResumeData(BaseModel):
     """Main model for resume data structure"""
+    model_config = _MODEL_CONFIG
+
     personal_info: PersonalInfo
     experience: List[Experience]
     education: List[Education]
@@ -90,12 +132,126 @@ class ResumeData(BaseModel):
     soft_skills: str
     projects: List[Project]
 
-# Template for the prompt sent to Groq LLM
-GROQ_PROMPT_TEMPLATE = """
-You are a resume generation expert. Based on the user's input below, create a structured and professional resume. 
+# Static system prompt sent first on every request. It must stay byte-identical
+# across calls so Groq's prompt cache can reuse the prefix; per-user data only
+# goes into the user message built from GROQ_PROMPT_TEMPLATE.
+STATIC_SYSTEM_PROMPT = """You are a resume writing assistant. Your task is to generate a professional resume in JSON format.
+Based on the user's input, create a structured and professional resume.
 Use action verbs, quantify achievements where possible, and format in standard US resume format.
+CRITICAL: You must ALWAYS return a valid JSON object with NO trailing commas, NO line breaks within strings, and NO markdown formatting.
+
+Required JSON structure:
+{
+    "name": string,
+    "email": string,
+    "phone": string,
+    "location": string,
+    "linkedin": string,
+    "website": string,
+    "summary": string,
+    "experience": [
+        {
+            "company": string,
+            "position": string,
+            "location": string,
+            "dates": string,
+            "description": string[]
+        }
+    ],
+    "education": [
+        {
+            "degree": string,
+            "institution": string,
+            "location": string,
+            "dates": string,
+            "gpa": string
+        }
+    ],
+    "skills": {
+        "technical": string[],
+        "soft": string[]
+    },
+    "projects": [
+        {
+            "name": string,
+            "description": string
+        }
+    ]
+}
+
+IMPORTANT: The input contains multiple entries for experience, education, and projects. Each entry is numbered and should be processed as a separate item in the output JSON arrays.
+Output a JSON with the following keys: name, summary, experience, education, skills, and projects.
+Use bullet points where needed. Return only valid JSON."""
+
+# JSON schema for the LLM's reply, matching the structure in STATIC_SYSTEM_PROMPT.
+# Fields the input may not provide (links, GPA, locations, dates) may be null.
+_NULLABLE_STRING = {"type": ["string", "null"]}
+RESUME_SCHEMA = {
+    "type": "object",
+    "required": ["name", "summary", "experience", "education", "skills", "projects"],
+    "properties": {
+        "name": {"type": "string"},
+        "email": _NULLABLE_STRING,
+        "phone": _NULLABLE_STRING,
+        "location": _NULLABLE_STRING,
+        "linkedin": _NULLABLE_STRING,
+        "website": _NULLABLE_STRING,
+        "summary": {"type": "string"},
+        "experience": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["company", "position", "description"],
+                "properties": {
+                    "company": {"type": "string"},
+                    "position": {"type": "string"},
+                    "location": _NULLABLE_STRING,
+                    "dates": _NULLABLE_STRING,
+                    "description": {"type": "array", "items": {"type": "string"}}
+                }
+            }
+        },
+        "education": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["degree", "institution"],
+                "properties": {
+                    "degree": {"type": "string"},
+                    "institution": {"type": "string"},
+                    "location": _NULLABLE_STRING,
+                    "dates": _NULLABLE_STRING,
+                    "gpa": _NULLABLE_STRING
+                }
+            }
+        },
+        "skills": {
+            "type": "object",
+            "required": ["technical", "soft"],
+            "properties": {
+                "technical": {"type": "array", "items": {"type": "string"}},
+                "soft": {"type": "array", "items": {"type": "string"}}
+            }
+        },
+        "projects": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name", "description"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "description": {"type": "string"}
+                }
+            }
+        }
+    }
+}
 
-## Personal Information:
+# Compiled once at import; fastjsonschema generates a specialised validator function
+validate_resume = fastjsonschema.compile(RESUME_SCHEMA)
+
+# Template for the per-request user message sent to Groq LLM (variable fields only)
+GROQ_PROMPT_TEMPLATE = """## Personal Information:
 Name: {name}
 Email: {email}
 Phone: {phone}
@@ -116,15 +272,92 @@ Summary: {summary}
 
 ## Projects:
 {projects}
-
-IMPORTANT: The input contains multiple entries for experience, education, and projects. Each entry is numbered and should be processed as a separate item in the output JSON arrays.
-Output a JSON with the following keys: name, summary, experience, education, skills, and projects.
-Use bullet points where needed. Return only valid JSON.
 """
 
+# GROQ_PROMPT_TEMPLATE split once into literal text and field names, so building
+# a prompt is a single join instead of re-parsing the template on every request
+_PROMPT_SEGMENTS = [
+    segment
+    for literal, field, _, _ in string.Formatter().parse(GROQ_PROMPT_TEMPLATE)
+    for segment in (literal, (field,) if field is not None else None)
+    if segment
+]
+
+# Client errors that will fail the same way on every attempt
+_NON_RETRYABLE_ERRORS = (
+    groq.BadRequestError,
+    groq.AuthenticationError,
+    groq.PermissionDeniedError,
+    groq.NotFoundError,
+)
+
+class ResumeGenerationError(Exception):
+    """Raised when a resume could not be generated because Groq or its output failed."""
+
+def _is_json_validate_failed(error: Exception) -> bool:
+    """
+    Return True for the 400 Groq returns when JSON mode output is invalid.
+    
+    This usually means the model ran out of tokens mid-object, which a new
+    sample can avoid, so unlike other 400s it is worth retrying.
+    """
+    body = getattr(error, "body", None)
+    if isinstance(body, dict):
+        body = body.get("error", body)
+    code = body.get("code") if isinstance(body, dict) else getattr(error, "code", None)
+    return code == "json_validate_failed"
+
+# Maximum number of generated resumes kept in memory
+RESUME_CACHE_SIZE = 256
+
+# Maximum number of background PDF jobs remembered for polling
+PDF_JOB_LIMIT = 256
+
+# Background PDF renders keyed by job ID, oldest first
+_pdf_jobs: "OrderedDict[str, asyncio.Task]" = OrderedDict()
+
+# Seconds a PDF job's state stays in Redis
+PDF_JOB_TTL = 3600
+
+# PDF job states ({status, pdf | detail}) shared with every worker through Redis, so a
+# job can be polled from any worker. Without REDIS_URL, jobs are only visible to the
+# worker that started them.
+_pdf_store = RedisLLMCache(os.getenv("REDIS_URL"), "resume_pdf") if os.getenv("REDIS_URL") else None
+
+# Most resumes a batch generates with regular calls at once when it falls back
+BATCH_FALLBACK_CONCURRENCY = 4
+
+# Maximum number of background batch generation jobs remembered for polling
+BATCH_JOB_LIMIT = 32
+
+# Seconds a batch job's state stays in Redis
+BATCH_JOB_TTL = 24 * 3600
+
+# Background batch generations keyed by job ID, oldest first
+_batch_jobs: "OrderedDict[str, asyncio.Task]" = OrderedDict()
+
+# Batch job states shared with every worker through Redis, like _pdf_store
+_batch_store = RedisLLMCache(os.getenv("REDIS_URL"), "resume_batch") if os.getenv("REDIS_URL") else None
+
+# Generated results keyed by a hash of the submitted resume data
+_resume_cache: "OrderedDict[str, Dict]" = OrderedDict()
+
+# Near-duplicate resumes reuse the generated JSON (no-op unless SEMANTIC_CACHE_ENABLED is set)
+_semantic_cache = SemanticCache(threshold=0.97)
+
+# A4 page with 20mm margins, matching the previous wkhtmltopdf options
+_PAGE_CSS = CSS(string="@page { size: A4; margin: 20mm; }")
+
 # Initialize Jinja2 environment
+# Templates are static at runtime: skip the per-render stat() and keep compiled
+# bytecode in the system temp directory across worker restarts
 template_dir = os.path.join(os.path.dirname(__file__), 'templates')
-env = Environment(loader=FileSystemLoader(template_dir))
+env = Environment(
+    loader=FileSystemLoader(template_dir),
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache()
+)
+TEMPLATE = env.get_template('resume_template.html')
 
 def generate_resume_html(resume_data: Dict) -> str:
     """
@@ -136,8 +369,12 @@ def generate_resume_html(resume_data: Dict) -> str:
     Returns:
         str: Generated HTML resume
     """
-    template = env.get_template('resume_template.html')
-    return template.render(resume=resume_data)
+    return _render_html_cached(orjson.dumps(resume_data, option=orjson.OPT_SORT_KEYS).decode())
+
+@lru_cache(maxsize=128)
+def _render_html_cached(key_json: str) -> str:
+    """Render the template for a canonical JSON string, memoized so identical resumes skip Jinja2."""
+    return TEMPLATE.render(resume=orjson.loads(key_json))
 
 def format_input_for_prompt(form_data: ResumeData) -> str:
     """
@@ -157,52 +394,52 @@ def format_input_for_prompt(form_data: ResumeData) -> str:
     # Format experience entries with clear numbering and structure
     exp_blocks = []
     for i, job in enumerate(form_data.experience, 1):
-        block = f"Experience Entry {i}:\n"
-        block += f"Position: {job.job_title}\n"
-        block += f"Company: {job.company}\n"
-        block += f"Period: {job.start_date} - {job.end_date}\n"
-        block += f"Location: {job.location}\n"
-        block += "Description:\n"
         # Split description into bullet points if it contains them
         if "●" in job.description:
             desc_points = [d.strip() for d in job.description.split("●") if d.strip()]
         else:
             desc_points = [job.description]
-        for point in desc_points:
-            block += f"- {point.strip()}\n"
+        parts = [
+            f"Experience Entry {i}:\n"
+            f"Position: {job.job_title}\n"
+            f"Company: {job.company}\n"
+            f"Period: {job.start_date} - {job.end_date}\n"
+            f"Location: {job.location}\n"
+            "Description:\n"
+        ]
+        parts.extend(f"- {point.strip()}\n" for point in desc_points)
         if job.achievements:
-            block += "Achievements:\n"
-            for a in job.achievements:
-                if a.strip():  # Only add non-empty achievements
-                    block += f"- {a.strip()}\n"
-        exp_blocks.append(block)
+            parts.append("Achievements:\n")
+            # Only add non-empty achievements
+            parts.extend(f"- {a.strip()}\n" for a in job.achievements if a.strip())
+        exp_blocks.append("".join(parts))
 
     # Format education entries with clear numbering and structure
     edu_blocks = []
     for i, edu in enumerate(form_data.education, 1):
-        block = f"Education Entry {i}:\n"
-        block += f"Degree: {edu.degree}\n"
-        block += f"Institution: {edu.institution}\n"
-        block += f"Graduation: {edu.graduation_date}\n"
-        block += f"Location: {edu.location}"
-        if edu.gpa:
-            block += f"\nGPA: {edu.gpa}"
-        edu_blocks.append(block)
+        gpa = f"\nGPA: {edu.gpa}" if edu.gpa else ""
+        edu_blocks.append(
+            f"Education Entry {i}:\n"
+            f"Degree: {edu.degree}\n"
+            f"Institution: {edu.institution}\n"
+            f"Graduation: {edu.graduation_date}\n"
+            f"Location: {edu.location}{gpa}"
+        )
 
     # Format project entries with clear numbering and structure
-    project_blocks = []
-    for i, p in enumerate(form_data.projects, 1):
-        block = f"Project Entry {i}:\n"
-        block += f"Title: {p.title}\n"
-        block += f"Description: {p.description}"
-        project_blocks.append(block)
+    project_blocks = [
+        f"Project Entry {i}:\n"
+        f"Title: {p.title}\n"
+        f"Description: {p.description}"
+        for i, p in enumerate(form_data.projects, 1)
+    ]
 
     # Format skills with clear separation
     technical_skills = [skill.strip() for skill in form_data.technical_skills.split(',') if skill.strip()]
     soft_skills = [skill.strip() for skill in form_data.soft_skills.split(',') if skill.strip()]
 
     # Return formatted prompt with clear section headers
-    return GROQ_PROMPT_TEMPLATE.format(
+    fields = dict(
         name=personal_info.full_name,
         email=personal_info.email,
         phone=personal_info.phone,
@@ -216,188 +453,486 @@ def format_input_for_prompt(form_data: ResumeData) -> str:
         soft_skills=", ".join(soft_skills),
         projects="\n\n".join(project_blocks),
     )
+    return "".join(
+        fields[segment[0]] if isinstance(segment, tuple) else segment
+        for segment in _PROMPT_SEGMENTS
+    )
 
-def generate_resume(resume_data: ResumeData):
+def _resume_cache_key(resume_data: ResumeData) -> str:
     """
-    Generate a professional resume using the Groq LLM API.
+    Build a stable cache key for the submitted resume data.
     
     Args:
         resume_data (ResumeData): The structured resume data from the user
         
     Returns:
-        dict: Generated resume data and PDF
+        str: SHA-256 hex digest of the canonical JSON form of the data
+    """
+    canonical = orjson.dumps(resume_data.model_dump(), option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(canonical).hexdigest()
+
+def _completion_params(prompt: str) -> Dict:
+    """
+    Build the chat completion parameters for a resume prompt.
+    
+    Shared by the interactive and batch paths so both send identical requests.
+    
+    Args:
+        prompt (str): Formatted user prompt with the resume data
+        
+    Returns:
+        dict: Keyword arguments for chat.completions.create
+    """
+    return {
+        "model": "meta-llama/llama-4-maverick-17b-128e-instruct",
+        "messages": [
+            {
+                "role": "system", 
+                "content": STATIC_SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        "temperature": 0.7,
+        "max_tokens": 900,
+        # JSON mode keeps the reply to a bare JSON object, no prose or markdown fences
+        "response_format": {"type": "json_object"}
+    }
+
+async def _request_resume_json(client: groq.AsyncGroq, prompt: str) -> Dict:
+    """
+    Ask the Groq LLM for the structured resume and parse its JSON reply.
+    
+    Args:
+        client (groq.AsyncGroq): Groq API client
+        prompt (str): Formatted user prompt with the resume data
+        
+    Returns:
+        dict: Parsed resume JSON
+        
+    Raises:
+        ValueError: If the response is not valid JSON or does not match RESUME_SCHEMA
+    """
+    # JSON mode does not support streaming, so wait for the whole completion
+    completion = await client.chat.completions.create(**_completion_params(prompt))
+    return _parse_resume_json(completion.choices[0].message.content)
+
+def _parse_resume_json(response_text: str) -> Dict:
+    """
+    Parse and validate the LLM's resume reply.
+    
+    Args:
+        response_text (str): Raw message content returned by Groq
+        
+    Returns:
+        dict: Parsed resume JSON
         
     Raises:
-        Exception: If there's an error in resume generation
+        ValueError: If the response is not valid JSON or does not match RESUME_SCHEMA
     """
+    cleaned_text = response_text.strip()
+    
     try:
-        print("\n=== Starting Resume Generation ===")
-        print("Input data:", resume_data.dict())
+        # Parse and validate the JSON response
+        resume_json = orjson.loads(cleaned_text)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Parsed JSON: %s", orjson.dumps(resume_json, option=orjson.OPT_INDENT_2).decode())
+    except orjson.JSONDecodeError as e:
+        logger.error("JSON parse error: %s", e)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw response: %s", response_text)
+            logger.debug("Problematic text: %s", cleaned_text[max(0, e.pos-50):min(len(cleaned_text), e.pos+50)])
+        raise ValueError(f"Failed to parse AI response as JSON: {str(e)}")
+    
+    # Validate the structure before it reaches the template
+    try:
+        validate_resume(resume_json)
+    except fastjsonschema.JsonSchemaException as e:
+        raise ValueError(f"Invalid resume structure in response: {e.message}")
+    
+    return resume_json
+
+def _with_personal_info(resume_json: Dict, resume_data: ResumeData) -> Dict:
+    """
+    Copy a cached resume and overwrite its contact details with the submitted ones.
+    
+    A semantic cache hit can come from a resume that differs only in contact
+    details, which the LLM copies verbatim, so those fields are taken from the input.
+    
+    Args:
+        resume_json (Dict): Cached resume JSON
+        resume_data (ResumeData): The structured resume data from the user
         
-        # Initialize Groq client
-        client = groq.Groq(
-            api_key=os.getenv("GROQ_API_KEY")
-        )
-        print("Groq client initialized")
+    Returns:
+        dict: Resume JSON with the submitted contact details
+    """
+    personal_info = resume_data.personal_info
+    resume_json = copy.deepcopy(resume_json)
+    resume_json.update({
+        "name": personal_info.full_name,
+        "email": personal_info.email,
+        "phone": personal_info.phone,
+        "location": personal_info.location,
+        "linkedin": personal_info.linkedin or "",
+        "website": personal_info.website or ""
+    })
+    return resume_json
+
+def _render_pdf(html_resume: str) -> str:
+    """
+    Convert the HTML resume to a base64 encoded PDF using WeasyPrint.
+    
+    Args:
+        html_resume (str): Generated HTML resume
+        
+    Returns:
+        str: Base64 encoded PDF
+    """
+    # Rendered in-process, so there is no wkhtmltopdf subprocess per request
+    pdf_content = HTML(string=html_resume).write_pdf(stylesheets=[_PAGE_CSS])
+    return base64.b64encode(pdf_content).decode('utf-8')
+
+async def _run_pdf_job(job_id: str, html_resume: str) -> str:
+    """
+    Render a PDF job in a worker thread and publish its outcome to the shared store.
+    
+    Args:
+        job_id (str): Job ID of the render
+        html_resume (str): Generated HTML resume
+        
+    Returns:
+        str: Base64 encoded PDF
+    """
+    try:
+        pdf_base64 = await asyncio.to_thread(_render_pdf, html_resume)
+    except Exception as e:
+        if _pdf_store is not None:
+            await _pdf_store.set(job_id, {"status": "error", "detail": str(e)}, PDF_JOB_TTL)
+        raise
+    if _pdf_store is not None:
+        await _pdf_store.set(job_id, {"status": "success", "pdf": pdf_base64}, PDF_JOB_TTL)
+    return pdf_base64
+
+def _failed(task: asyncio.Task) -> bool:
+    """Return True if a finished background task was cancelled or raised."""
+    return task.done() and (task.cancelled() or task.exception() is not None)
+
+def _evict_finished(jobs: "OrderedDict[str, asyncio.Task]", limit: int) -> None:
+    """
+    Forget the oldest finished jobs until at most limit remain.
+    
+    Running jobs are never evicted: the table holds the only strong reference to
+    their tasks, and the event loop may garbage-collect an unreferenced task mid-run.
+    """
+    for job_id in [job_id for job_id, task in jobs.items() if task.done()]:
+        if len(jobs) <= limit:
+            break
+        del jobs[job_id]
+
+def _job_state(task: asyncio.Task, result_key: str) -> Dict:
+    """Describe a local background job as {"status": ...}, carrying its result under result_key."""
+    if not task.done():
+        return {"status": "pending"}
+    if _failed(task):
+        return {"status": "error", "detail": "Job was cancelled" if task.cancelled() else str(task.exception())}
+    return {"status": "success", result_key: task.result()}
+
+async def _ensure_pdf_job(html_resume: str) -> Tuple[str, asyncio.Task]:
+    """
+    Return the background PDF job for the HTML resume, starting one if needed.
+    
+    A job that failed is replaced rather than reused, so a transient render error
+    is retried on the next request.
+    
+    Args:
+        html_resume (str): Generated HTML resume
+        
+    Returns:
+        Tuple[str, asyncio.Task]: Job ID and the task resolving to the base64 encoded PDF
+    """
+    job_id = hashlib.sha256(html_resume.encode('utf-8')).hexdigest()[:32]
+    task = _pdf_jobs.get(job_id)
+    if task is not None and not _failed(task):
+        _pdf_jobs.move_to_end(job_id)
+        return job_id, task
+    
+    # Mark the job pending before it starts, so the pending write can never land
+    # after (and overwrite) the job's own final state
+    if _pdf_store is not None:
+        await _pdf_store.set(job_id, {"status": "pending"}, PDF_JOB_TTL)
+    
+    # Another request may have started the same job while the store was written
+    task = _pdf_jobs.get(job_id)
+    if task is None or _failed(task):
+        logger.debug("Starting PDF job %s", job_id)
+        task = asyncio.create_task(_run_pdf_job(job_id, html_resume))
+        _pdf_jobs.pop(job_id, None)
+        _pdf_jobs[job_id] = task
+        _evict_finished(_pdf_jobs, PDF_JOB_LIMIT)
+    return job_id, task
+
+async def start_pdf_job(html_resume: str) -> str:
+    """
+    Start rendering the HTML resume to PDF in the background.
+    
+    Jobs are keyed by a hash of the HTML, so requesting the PDF for a resume
+    that is already rendering or rendered reuses the existing job. When Redis
+    is configured the job is marked pending there before it starts, so other
+    workers can answer polls for it.
+    
+    Args:
+        html_resume (str): Generated HTML resume
+        
+    Returns:
+        str: Job ID to poll with get_pdf_job
+    """
+    job_id, _ = await _ensure_pdf_job(html_resume)
+    return job_id
 
+async def get_pdf_job(job_id: str) -> Optional[Dict]:
+    """
+    Look up the state of a background PDF job started by any worker.
+    
+    Args:
+        job_id (str): Job ID returned by start_pdf_job
+        
+    Returns:
+        Optional[Dict]: {"status": "pending"}, {"status": "success", "pdf": ...} or
+        {"status": "error", "detail": ...}; None if the job is unknown
+    """
+    job = _pdf_jobs.get(job_id)
+    if job is None:
+        return await _pdf_store.get(job_id) if _pdf_store is not None else None
+    return _job_state(job, "pdf")
+
+async def render_pdf(html_resume: str) -> str:
+    """
+    Render the HTML resume to PDF, reusing a background job for the same HTML.
+    
+    Args:
+        html_resume (str): Generated HTML resume
+        
+    Returns:
+        str: Base64 encoded PDF
+    """
+    _, task = await _ensure_pdf_job(html_resume)
+    # Shielded so a disconnecting caller does not cancel the job for other pollers
+    return await asyncio.shield(task)
+
+def _build_result(cache_key: str, resume_json: Dict) -> Dict:
+    """
+    Render the resume JSON to HTML and cache the finished result.
+    
+    Args:
+        cache_key (str): Cache key of the submitted resume data
+        resume_json (Dict): Parsed resume JSON
+        
+    Returns:
+        dict: Generated resume data and HTML
+    """
+    # Generate HTML resume
+    logger.debug("Generating HTML")
+    html_resume = generate_resume_html(resume_json)
+    
+    result = {
+        "status": "success",
+        "resume": resume_json,
+        "html": html_resume
+    }
+    _resume_cache[cache_key] = result
+    if len(_resume_cache) > RESUME_CACHE_SIZE:
+        _resume_cache.popitem(last=False)
+    return result
+
+async def generate_resume_json(resume_data: ResumeData) -> Dict:
+    """
+    Generate a professional resume using the Groq LLM API, without the PDF.
+    
+    Identical resume data returns the previously generated result without
+    calling Groq. Near-duplicate data reuses the cached resume JSON when the
+    optional semantic cache is enabled. Use start_pdf_job or render_pdf on the
+    returned HTML to get the PDF.
+    
+    Args:
+        resume_data (ResumeData): The structured resume data from the user
+        
+    Returns:
+        dict: Generated resume data and HTML
+        
+    Raises:
+        ResumeGenerationError: If Groq fails or keeps returning unusable output
+    """
+    try:
+        logger.debug("Starting resume generation")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Input data: %s", orjson.dumps(resume_data.model_dump()).decode())
+        
+        cache_key = _resume_cache_key(resume_data)
+        if cache_key in _resume_cache:
+            logger.debug("Returning cached resume")
+            _resume_cache.move_to_end(cache_key)
+            return _resume_cache[cache_key]
+        
         # Format and send prompt to Groq
         prompt = format_input_for_prompt(resume_data)
-        print("\n=== Sending Prompt to Groq ===")
-        print(prompt)
+        logger.debug("Sending prompt to Groq:\n%s", prompt)
+        
+        resume_json = None
+        # Embedding the prompt is CPU-bound, so keep it off the event loop
+        similar_resume = await asyncio.to_thread(_semantic_cache.lookup, prompt)
+        if similar_resume is not None:
+            logger.debug("Semantic cache hit, skipping Groq")
+            resume_json = _with_personal_info(similar_resume, resume_data)
         
         max_retries = 3
         retry_count = 0
         
         while retry_count < max_retries:
             try:
-                # Get completion from Groq
-                completion = client.chat.completions.create(
-                    model="meta-llama/llama-4-maverick-17b-128e-instruct",
-                    messages=[
-                        {
-                            "role": "system", 
-                            "content": """You are a resume writing assistant. Your task is to generate a professional resume in JSON format.
-                                CRITICAL: You must ALWAYS return a valid JSON object with NO trailing commas, NO line breaks within strings, and NO markdown formatting.
-                                
-                                Required JSON structure:
-                                {
-                                    "name": string,
-                                    "email": string,
-                                    "phone": string,
-                                    "location": string,
-                                    "linkedin": string,
-                                    "website": string,
-                                    "summary": string,
-                                    "experience": [
-                                        {
-                                            "company": string,
-                                            "position": string,
-                                            "location": string,
-                                            "dates": string,
-                                            "description": string[]
-                                        }
-                                    ],
-                                    "education": [
-                                        {
-                                            "degree": string,
-                                            "institution": string,
-                                            "location": string,
-                                            "dates": string,
-                                            "gpa": string
-                                        }
-                                    ],
-                                    "skills": {
-                                        "technical": string[],
-                                        "soft": string[]
-                                    },
-                                    "projects": [
-                                        {
-                                            "name": string,
-                                            "description": string
-                                        }
-                                    ]
-                                }"""
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    temperature=0.7,
-                    max_tokens=2000
-                )
-                
-                # Extract and clean the response
-                response_text = completion.choices[0].message.content
-                cleaned_text = response_text.strip()
-                
-                # Remove markdown code block formatting if present
-                if "```json" in cleaned_text:
-                    cleaned_text = cleaned_text.split("```json")[1].split("```")[0].strip()
-                elif "```" in cleaned_text:
-                    cleaned_text = cleaned_text.split("```")[1].split("```")[0].strip()
+                if resume_json is None:
+                    resume_json = await _request_resume_json(_GROQ_CLIENT, prompt)
+                    await asyncio.to_thread(_semantic_cache.add, prompt, resume_json)
                 
-                try:
-                    # Parse and validate the JSON response
-                    resume_json = json.loads(cleaned_text)
-                    print("\n=== Parsed JSON ===")
-                    print(json.dumps(resume_json, indent=2))
-                    
-                    # Validate required fields
-                    required_fields = ["name", "summary", "experience", "education", "skills", "projects"]
-                    missing_fields = [field for field in required_fields if field not in resume_json]
-                    
-                    if missing_fields:
-                        raise ValueError(f"Missing required fields in response: {', '.join(missing_fields)}")
-                    
-                    # Generate HTML resume
-                    print("\n=== Generating HTML ===")
-                    html_resume = generate_resume_html(resume_json)
-                    
-                    # Convert HTML to PDF using pdfkit
-                    print("\n=== Converting to PDF ===")
-                    
-                    # Create a temporary directory for PDF generation
-                    with tempfile.TemporaryDirectory() as temp_dir:
-                        temp_pdf_path = os.path.join(temp_dir, 'resume.pdf')
-                        
-                        # Configure pdfkit options
-                        options = {
-                            'page-size': 'A4',
-                            'margin-top': '20mm',
-                            'margin-right': '20mm',
-                            'margin-bottom': '20mm',
-                            'margin-left': '20mm',
-                            'encoding': 'UTF-8',
-                            'no-outline': None,
-                            'quiet': '',
-                            'enable-local-file-access': None
-                        }
-                        
-                        try:
-                            # Convert HTML to PDF
-                            pdfkit.from_string(html_resume, temp_pdf_path, options=options)
-                            
-                            # Read the generated PDF and encode it as base64
-                            with open(temp_pdf_path, 'rb') as pdf_file:
-                                pdf_content = pdf_file.read()
-                                pdf_base64 = base64.b64encode(pdf_content).decode('utf-8')
-                            
-                            print("\n=== Resume Generation Complete ===")
-                            return {
-                                "status": "success",
-                                "resume": resume_json,
-                                "html": html_resume,
-                                "pdf": pdf_base64  # Return base64 encoded PDF
-                            }
-                            
-                        except Exception as e:
-                            print(f"\n=== PDF Generation Error ===")
-                            print(f"Error: {str(e)}")
-                            if retry_count < max_retries - 1:
-                                time.sleep(1)  # Add a small delay between retries
-                                retry_count += 1
-                                continue
-                            raise ValueError(f"Failed to generate PDF after {max_retries} attempts: {str(e)}")
-                    
-                except json.JSONDecodeError as e:
-                    print(f"\n=== JSON Parse Error ===")
-                    print(f"Error: {str(e)}")
-                    print(f"Raw response: {response_text}")
-                    print(f"Cleaned text: {cleaned_text}")
-                    print(f"Problematic text: {cleaned_text[max(0, e.pos-50):min(len(cleaned_text), e.pos+50)]}")
-                    raise ValueError(f"Failed to parse AI response as JSON: {str(e)}")
+                result = _build_result(cache_key, resume_json)
+                logger.debug("Resume generation complete")
+                return result
                 
             except Exception as e:
-                print(f"\n=== Attempt {retry_count + 1} Failed ===")
-                print(f"Error: {str(e)}")
+                if isinstance(e, _NON_RETRYABLE_ERRORS) and not _is_json_validate_failed(e):
+                    raise
+                logger.warning("Attempt %d failed: %s", retry_count + 1, e)
                 retry_count += 1
                 if retry_count == max_retries:
-                    raise ValueError(f"All {max_retries} attempts failed to generate valid JSON: {str(e)}")
-                time.sleep(1)  # Add a small delay between retries
+                    raise ResumeGenerationError(f"All {max_retries} attempts failed to generate the resume: {str(e)}")
+                # Exponential backoff with jitter so rate-limited retries don't line up
+                await asyncio.sleep(min(2 ** retry_count + random.uniform(0, 0.5), 30))
                 continue
             
     except Exception as e:
-        print(f"\n=== Resume Generation Error ===")
-        print(f"Error: {str(e)}")
-        raise ValueError(f"Failed to generate resume: {str(e)}")
\ No newline at end of file
+        logger.error("Resume generation error: %s", e)
+        raise ResumeGenerationError(f"Failed to generate resume: {str(e)}") from e
+
+async def generate_resume(resume_data: ResumeData) -> Dict:
+    """
+    Generate a professional resume including its base64 encoded PDF.
+    
+    Args:
+        resume_data (ResumeData): The structured resume data from the user
+        
+    Returns:
+        dict: Generated resume data, HTML and PDF
+        
+    Raises:
+        ResumeGenerationError: If there's an error in resume generation
+    """
+    result = await generate_resume_json(resume_data)
+    return {**result, "pdf": await render_pdf(result["html"])}
+
+async def generate_resumes_batch(items: List[ResumeData], fallback_seconds: float = 15 * 60,
+                                 poll_interval: float = 30) -> List[Dict]:
+    """
+    Generate many resumes through the Groq Batch API for non-interactive workloads.
+    
+    Batch requests cost less than individual calls but may take a while. If the
+    batch has not finished after fallback_seconds it is cancelled and the resumes
+    are generated with concurrent regular calls instead. Items the batch could not
+    produce valid JSON for are also retried individually.
+    
+    Args:
+        items (List[ResumeData]): The structured resume data to generate
+        fallback_seconds (float): Seconds to wait for the batch before falling back
+        poll_interval (float): Seconds between batch status checks
+        
+    Returns:
+        List[Dict]: One result per item, in input order; failed items have status "error"
+    """
+    logger.debug("Starting batch resume generation (%d items)", len(items))
+    cache_keys = [_resume_cache_key(item) for item in items]
+    pending = [i for i, key in enumerate(cache_keys) if key not in _resume_cache]
+    
+    contents = {}
+    if pending:
+        bodies = [_completion_params(format_input_for_prompt(items[i])) for i in pending]
+        batch_contents = await run_batch(_GROQ_CLIENT, bodies, timeout=fallback_seconds, poll_interval=poll_interval)
+        if batch_contents is None:
+            logger.warning("Batch did not finish in time, falling back to regular requests")
+        else:
+            contents = {pending[index]: content for index, content in batch_contents.items()}
+    
+    # Bounds the individual Groq calls and PDF renders when many items fall back at once
+    limit = asyncio.Semaphore(BATCH_FALLBACK_CONCURRENCY)
+    
+    async def resolve(i: int) -> Dict:
+        try:
+            async with limit:
+                if i in contents:
+                    try:
+                        result = _build_result(cache_keys[i], _parse_resume_json(contents[i]))
+                        return {**result, "pdf": await render_pdf(result["html"])}
+                    except Exception as e:
+                        logger.warning("Batch result %d unusable, retrying individually: %s", i, e)
+                return await generate_resume(items[i])
+        except Exception as e:
+            return {"status": "error", "detail": str(e)}
+    
+    return list(await asyncio.gather(*(resolve(i) for i in range(len(items)))))
+
+async def _run_batch_job(job_id: str, items: List[ResumeData]) -> List[Dict]:
+    """
+    Run generate_resumes_batch as a background job and publish its outcome to the shared store.
+    
+    Args:
+        job_id (str): Job ID of the batch
+        items (List[ResumeData]): The structured resume data to generate
+        
+    Returns:
+        List[Dict]: One result per item, in input order
+    """
+    try:
+        results = await generate_resumes_batch(items)
+    except Exception as e:
+        logger.error("Batch resume generation failed: %s", e)
+        if _batch_store is not None:
+            await _batch_store.set(job_id, {"status": "error", "detail": str(e)}, BATCH_JOB_TTL)
+        raise
+    if _batch_store is not None:
+        await _batch_store.set(job_id, {"status": "success", "results": results}, BATCH_JOB_TTL)
+    return results
+
+async def start_resume_batch_job(items: List[ResumeData]) -> str:
+    """
+    Start generating many resumes through the Groq Batch API in the background.
+    
+    Args:
+        items (List[ResumeData]): The structured resume data to generate
+        
+    Returns:
+        str: Job ID to poll with get_resume_batch_job
+    """
+    job_id = uuid.uuid4().hex
+    # Marked pending before the job starts, so this write can never overwrite its final state
+    if _batch_store is not None:
+        await _batch_store.set(job_id, {"status": "pending"}, BATCH_JOB_TTL)
+    
+    logger.debug("Starting batch job %s (%d items)", job_id, len(items))
+    _batch_jobs[job_id] = asyncio.create_task(_run_batch_job(job_id, items))
+    _evict_finished(_batch_jobs, BATCH_JOB_LIMIT)
+    return job_id
+
+async def get_resume_batch_job(job_id: str) -> Optional[Dict]:
+    """
+    Look up the state of a background batch generation job started by any worker.
+    
+    Args:
+        job_id (str): Job ID returned by start_resume_batch_job
+        
+    Returns:
+        Optional[Dict]: {"status": "pending"}, {"status": "success", "results": [...]} or
+        {"status": "error", "detail": ...}; None if the job is unknown
+    """
+    job = _batch_jobs.get(job_id)
+    if job is None:
+        return await _batch_store.get(job_id) if _batch_store is not None else None
+    return _job_state(job, "results")
@@ -38,58 +38,365 @@ improving their chances of passing ATS systems and catching recruiters' attentio
 """
 
 import os
+import re
+import random
+import orjson
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 import groq
-import PyPDF2
+import httpx
+import tiktoken
+from dotenv import load_dotenv
 from fastapi import HTTPException
+from pydantic import BaseModel, ConfigDict, ValidationError
+from groq_batch import submit_batch, fetch_batch_results, batch_request_count, FINAL_STATUSES
+from llm_cache import create_llm_cache, make_cache_key
+from semantic_cache import SemanticCache
 
-def extract_text_from_pdf(pdf_file) -> str:
+# Load environment variables before the module-level Groq client reads GROQ_API_KEY
+load_dotenv()
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Model used for analyses; part of the cache key so a model change never serves stale results
+ANALYSIS_MODEL = "meta-llama/llama-4-maverick-17b-128e-instruct"
+
+# Fixed sampling seed for analysis requests
+ANALYSIS_SEED = 42
+
+# Seconds a cached analysis stays valid
+ANALYSIS_CACHE_TTL = 86400
+
+# Exact-match cache of analyses, in process and in Redis when REDIS_URL is set
+_analysis_cache = create_llm_cache("analysis")
+
+# Analyses currently waiting on Groq, so concurrent identical requests share one call
+_inflight: "Dict[str, asyncio.Task]" = {}
+
+# Most Groq analysis calls a worker makes at once; further distinct analyses queue
+# here instead of piling onto Groq and tripping its per-minute rate limit
+MAX_CONCURRENT_ANALYSES = int(os.getenv("MAX_CONCURRENT_ANALYSES", "8"))
+
+# Created on first use, inside the running event loop (required on Python 3.9)
+_analysis_slots = None
+
+def _get_analysis_slots() -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent Groq analysis calls."""
+    global _analysis_slots
+    if _analysis_slots is None:
+        _analysis_slots = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+    return _analysis_slots
+
+# Near-duplicate (resume, job description) pairs, such as a lightly reworded job
+# description, reuse a previous analysis (no-op unless SEMANTIC_CACHE_ENABLED is set).
+# Set SEMANTIC_CACHE_PATH to persist entries to a SQLite file.
+_semantic_cache = SemanticCache(
+    threshold=0.92,
+    max_entries=10000,
+    persist_path=os.getenv("SEMANTIC_CACHE_PATH")
+)
+
+# Shared client so every analysis reuses pooled keep-alive connections instead of a new TLS handshake.
+# HTTP/2 multiplexes concurrent analyses over one connection. When a transport is passed, httpx
+# ignores the client-level http2/limits options, so they are set on the transport itself.
+# The SDK's own retries are disabled; _create_completion retries with jittered backoff instead.
+_GROQ_CLIENT = groq.AsyncGroq(
+    api_key=os.getenv("GROQ_API_KEY"),
+    max_retries=0,
+    http_client=httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            retries=2
+        ),
+        timeout=httpx.Timeout(30.0, connect=5.0)
+    )
+)
+
+# Transient Groq failures worth retrying: rate limits, connection errors and timeouts, and 5xx
+_RETRYABLE_ERRORS = (groq.RateLimitError, groq.APIConnectionError, groq.InternalServerError)
+MAX_ATTEMPTS = 3
+
+async def close_client() -> None:
+    """Close the shared Groq client and its connection pool; called on app shutdown."""
+    await _GROQ_CLIENT.close()
+
+# Role and rules shared by the single and multi-resume prompts
+_ANALYSIS_RULES = """You are a professional resume optimization expert.
+Your task is to analyze resumes against job descriptions and provide
+detailed, actionable feedback.
+
+Important rules:
+1. Be specific and actionable in your feedback
+2. Focus on concrete examples and suggestions
+3. Keep each item to a single plain-text point without Markdown
+4. Maintain a professional and constructive tone
+5. Ensure each list has at least 3-5 points
+
+"""
+
+# Instructions for the analysis; kept byte-identical across calls so the prefix can be cached
+_SYSTEM_PROMPT = _ANALYSIS_RULES + """Analyze the resume against the job description in the user's message and
+respond with JSON only, using exactly this structure:
+{
+    "strengths": string[],
+    "weaknesses": string[],
+    "suggestions": string[]
+}
+
+- strengths: the candidate's key strengths that match the job requirements,
+  focusing on relevant experience, skills, and achievements
+- weaknesses: gaps between the resume and job requirements, missing skills or
+  experience, and areas that need enhancement
+- suggestions: specific, actionable suggestions to improve the resume, including
+  better presentation and ways to highlight relevant experience"""
+
+# Instructions for analyzing several resumes against one job description in a single call
+_MULTI_SYSTEM_PROMPT = _ANALYSIS_RULES + """The user's message contains one job description followed by several resumes,
+each introduced by a [Resume N] marker. Analyze every resume against the job
+description on its own and respond with JSON only, using exactly this structure:
+{
+    "analyses": [
+        {
+            "resume": number,
+            "strengths": string[],
+            "weaknesses": string[],
+            "suggestions": string[]
+        }
+    ]
+}
+
+Include one entry per resume, in the order given, with "resume" set to its number.
+- strengths: the candidate's key strengths that match the job requirements
+- weaknesses: gaps between the resume and job requirements
+- suggestions: specific, actionable suggestions to improve the resume"""
+
+# Fixed text around the data in the per-request user message, joined in _build_prompt
+_PROMPT_PARTS = ("Resume:\n", "\n\nJob Description:\n")
+
+class Analysis(BaseModel):
+    """Shape of the JSON analysis the model is asked for; a bare string is accepted for any list."""
+    model_config = ConfigDict(extra='ignore')
+
+    strengths: Union[List[str], str] = []
+    weaknesses: Union[List[str], str] = []
+    suggestions: Union[List[str], str] = []
+
+class _NumberedAnalysis(Analysis):
+    resume: Optional[int] = None
+
+class _MultiAnalysis(BaseModel):
+    """Shape of the JSON the model is asked for when analyzing several resumes at once."""
+    model_config = ConfigDict(extra='ignore')
+
+    analyses: List[_NumberedAnalysis] = []
+
+# Limits for packing several resumes into one multi-analysis call: at most this many
+# resumes, and this many prompt tokens; the reply gets the single-analysis output budget per resume
+MULTI_ANALYSIS_MAX_RESUMES = 8
+MULTI_ANALYSIS_PROMPT_BUDGET = 16000
+ANALYSIS_MAX_TOKENS = 1000
+
+# Token budgets for the prompt inputs; anything beyond is cut off before sending
+RESUME_TOKEN_BUDGET = 2500
+JOB_DESC_TOKEN_BUDGET = 1500
+
+# Three or more line breaks, possibly with trailing spaces; PDF text uses \r\n
+_BLANK_LINES_RE = re.compile(r"(?:[ \t]*\r?\n){3,}")
+
+_encoding = None
+
+def _get_encoding():
+    """Load the tokenizer once per process, on first use."""
+    global _encoding
+    if _encoding is None:
+        _encoding = tiktoken.get_encoding("cl100k_base")
+    return _encoding
+
+def _clip(text: str, max_tokens: int) -> str:
+    """Collapse runs of blank lines, then truncate text to at most max_tokens tokens."""
+    text = _BLANK_LINES_RE.sub("\n\n", text.strip())
+    ids = _get_encoding().encode(text)
+    return _get_encoding().decode(ids[:max_tokens]) if len(ids) > max_tokens else text
+
+def _build_prompt(resume_text: str, job_desc: str) -> str:
     """
-    Extract text content from a PDF file.
+    Build the user prompt for analyzing a resume against a job description.
+    
+    All instructions live in the system message so that it stays byte-identical
+    across calls and can be served from Groq's prompt prefix cache; the user
+    message carries only the per-request data, clipped to the token budgets.
     
     Args:
-        pdf_file: The uploaded PDF file
+        resume_text (str): The text content of the resume
+        job_desc (str): The job description to analyze against
         
     Returns:
-        str: Extracted text from the PDF
+        str: Formatted prompt string for the LLM
+    """
+    resume_text = _clip(resume_text, RESUME_TOKEN_BUDGET)
+    job_desc = _clip(job_desc, JOB_DESC_TOKEN_BUDGET)
+    return "".join((_PROMPT_PARTS[0], resume_text, _PROMPT_PARTS[1], job_desc))
+
+def _completion_params(prompt: str) -> dict:
+    """
+    Build the chat completion parameters for an analysis prompt.
+    
+    Shared by the interactive and batch paths so both send identical requests.
+    
+    Args:
+        prompt (str): Formatted user prompt
+        
+    Returns:
+        dict: Keyword arguments for chat.completions.create
+    """
+    return {
+        "model": ANALYSIS_MODEL,
+        "messages": [
+            {
+                "role": "system",
+                "content": _SYSTEM_PROMPT
+            },
+            {"role": "user", "content": prompt}
+        ],
+        # Deterministic sampling, so identical inputs give the response the cache holds
+        "temperature": 0.0,
+        "seed": ANALYSIS_SEED,
+        "top_p": 1.0,
+        "max_tokens": ANALYSIS_MAX_TOKENS,
+        "response_format": {"type": "json_object"}
+    }
+
+def _parse_sections(response_text: str) -> dict:
+    """
+    Parse the LLM's JSON analysis into strengths, weaknesses and suggestions.
+    
+    Each section is returned as newline-separated bullet points, the format the
+    frontend renders.
+    
+    Args:
+        response_text (str): Raw JSON message content returned by Groq
+        
+    Returns:
+        dict: Analysis sections, with a placeholder for any section that was not found
+        
+    Raises:
+        ValueError: If the response is not valid JSON matching the Analysis model
+    """
+    try:
+        parsed = Analysis.model_validate_json(response_text)
+    except ValidationError as e:
+        raise ValueError(f"Invalid AI response: {str(e)}")
+    return _sections_from(parsed)
+
+def _sections_from(parsed: Analysis) -> dict:
+    """Format a validated analysis as newline-separated bullet sections, filling in placeholders."""
+    sections = {}
+    for name in ("strengths", "weaknesses", "suggestions"):
+        items = getattr(parsed, name)
+        if isinstance(items, str):
+            items = [items]
+        sections[name] = "\n".join(f"- {item.strip()}" for item in items if item.strip())
+    
+    # Ensure all sections have content
+    if not sections["strengths"]:
+        sections["strengths"] = "No key strengths identified"
+    if not sections["weaknesses"]:
+        sections["weaknesses"] = "No areas for improvement identified"
+    if not sections["suggestions"]:
+        sections["suggestions"] = "No specific suggestions provided"
+    
+    return sections
+
+async def _analyze_uncached(resume_text: str, job_desc: str, cache_key: str) -> dict:
+    """
+    Produce an analysis that is not in the exact-match cache.
+    
+    Checks the semantic cache before calling Groq, and stores a freshly
+    generated analysis in both caches.
+    
+    Args:
+        resume_text (str): The text content of the resume
+        job_desc (str): The job description to analyze against
+        cache_key (str): Cache key of the resume and job description
+        
+    Returns:
+        dict: Analysis results containing strengths, weaknesses, and suggestions
         
     Raises:
-        HTTPException: If there's an error processing the PDF
+        HTTPException: If the Groq API call fails
     """
+    # Embedding the inputs is CPU-bound, so keep it off the event loop
+    semantic_text = resume_text + "\n\n" + job_desc
+    similar = await asyncio.to_thread(_semantic_cache.lookup, semantic_text)
+    if similar is not None:
+        logger.debug("Semantic cache hit, skipping Groq")
+        return dict(similar)
+    
+    prompt = _build_prompt(resume_text, job_desc)
+    
+    logger.debug("Making API call")
     try:
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
+        # JSON mode does not support streaming, so wait for the whole completion
+        async with _get_analysis_slots():
+            completion = await _create_completion(**_completion_params(prompt))
+        
+        # Process the response
+        response_text = completion.choices[0].message.content.strip()
+        logger.debug("Raw response from Groq:\n%s", response_text)
+        
+        sections = _parse_sections(response_text)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Final sections: %s", orjson.dumps(sections).decode())
+        
+        await _analysis_cache.set(cache_key, dict(sections), ANALYSIS_CACHE_TTL)
+        await asyncio.to_thread(_semantic_cache.add, semantic_text, dict(sections))
+        return sections
+        
     except Exception as e:
-        print(f"Error in extract_text_from_pdf: {str(e)}")
-        raise HTTPException(status_code=400, detail=f"Error processing PDF: {str(e)}")
+        logger.error("Groq API error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Groq API error: {str(e)}")
 
-def clean_markdown(text: str) -> str:
+async def _create_completion(**params):
     """
-    Remove Markdown formatting symbols from text.
+    Call chat.completions.create, retrying transient failures with jittered exponential backoff.
     
     Args:
-        text (str): Text containing Markdown symbols
+        **params: Keyword arguments for chat.completions.create
         
     Returns:
-        str: Cleaned text without Markdown symbols
+        The completion, or the chunk stream when stream=True
+        
+    Raises:
+        groq.APIError: If the last attempt fails, or on a non-retryable error
     """
-    # Remove bold/italic markers
-    text = text.replace('**', '')
-    text = text.replace('*', '')
-    # Remove headers
-    text = text.replace('##', '')
-    # Remove trailing # symbols
-    text = text.rstrip('#')
-    # Remove extra newlines and whitespace
-    text = '\n'.join(line.strip() for line in text.split('\n') if line.strip())
-    return text.strip()
-
-def analyze_resume(resume_text: str, job_desc: str) -> dict:
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return await _GROQ_CLIENT.chat.completions.create(**params)
+        except _RETRYABLE_ERRORS as e:
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+            delay = min(0.5 * 2 ** attempt + random.uniform(0, 1), 4)
+            logger.warning("Groq call failed (%s), retrying in %.1fs", e, delay)
+            await asyncio.sleep(delay)
+
+def _forget_inflight(cache_key: str, task: asyncio.Task) -> None:
+    """Drop a finished analysis from the in-flight table, marking its exception as retrieved."""
+    _inflight.pop(cache_key, None)
+    if not task.cancelled():
+        task.exception()
+
+async def analyze_resume(resume_text: str, job_desc: str) -> dict:
     """
     Analyze a resume against a job description using the Groq LLM API.
     
+    Concurrent calls with the same resume and job description share a single
+    in-flight analysis instead of each calling Groq.
+    
     Args:
         resume_text (str): The text content of the resume
         job_desc (str): The job description to analyze against
@@ -101,157 +408,284 @@ def analyze_resume(resume_text: str, job_desc: str) -> dict:
         HTTPException: If there's an error in the analysis process
     """
     try:
-        print("\n" + "="*50)
-        print("STARTING RESUME ANALYSIS")
-        print("="*50)
-        print(f"Resume text length: {len(resume_text)}")
-        print(f"Job description length: {len(job_desc)}")
+        logger.debug("Starting resume analysis (resume: %d chars, job description: %d chars)", len(resume_text), len(job_desc))
         
-        # Initialize Groq client
-        client = groq.Groq(
-            api_key=os.getenv("GROQ_API_KEY")
-        )
+        cache_key = make_cache_key(ANALYSIS_MODEL, resume=resume_text, jd=job_desc)
+        cached = await _analysis_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Returning cached analysis")
+            return dict(cached)
         
-        prompt = f"""
-        Analyze the following resume against the job description and provide a detailed analysis.
+        # No await between the lookup and the insert, so no lock is needed on the event loop
+        task = _inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(_analyze_uncached(resume_text, job_desc, cache_key))
+            _inflight[cache_key] = task
+            task.add_done_callback(lambda done: _forget_inflight(cache_key, done))
+        else:
+            logger.debug("Joining in-flight analysis")
         
-        Resume:
-        {resume_text}
+        # Shielded so one caller disconnecting does not cancel the analysis for the others
+        return dict(await asyncio.shield(task))
+            
+    except Exception as e:
+        logger.error("Error in analyze_resume: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to analyze resume: {str(e)}")
+
+async def _analyze_together(job_desc: str, resume_texts: List[str]) -> Dict[int, dict]:
+    """
+    Analyze several resumes against one job description in a single Groq call.
+    
+    The job description is sent once, so its tokens are not repeated per resume.
+    
+    Args:
+        job_desc (str): The clipped job description
+        resume_texts (List[str]): The clipped resume texts
         
-        Job Description:
-        {job_desc}
+    Returns:
+        Dict[int, dict]: Analysis sections by position in resume_texts; positions the
+        model left out are missing
         
-        Please provide a structured analysis with the following sections:
+    Raises:
+        ValueError: If the response is not valid JSON matching the expected structure
+    """
+    prompt = "".join(
+        ["Job Description:\n", job_desc]
+        + [f"\n\n[Resume {number}]\n{text}" for number, text in enumerate(resume_texts, 1)]
+    )
+    params = _completion_params(prompt)
+    params["messages"][0]["content"] = _MULTI_SYSTEM_PROMPT
+    params["max_tokens"] = ANALYSIS_MAX_TOKENS * len(resume_texts)
+    
+    async with _get_analysis_slots():
+        completion = await _create_completion(**params)
+    try:
+        parsed = _MultiAnalysis.model_validate_json(completion.choices[0].message.content.strip())
+    except ValidationError as e:
+        raise ValueError(f"Invalid AI response: {str(e)}")
+    
+    # Align by the resume number the model echoed back, or by position when it did not
+    results = {}
+    for position, analysis in enumerate(parsed.analyses):
+        index = analysis.resume - 1 if analysis.resume is not None else position
+        if 0 <= index < len(resume_texts) and index not in results:
+            results[index] = _sections_from(analysis)
+    return results
+
+async def _analyze_group(resume_texts: List[str], job_desc: str, cache_keys: List[str]) -> List[Optional[dict]]:
+    """
+    Run one multi-analysis call and cache its results.
+    
+    Args:
+        resume_texts (List[str]): The resume texts in the group
+        job_desc (str): The job description to analyze against
+        cache_keys (List[str]): Cache key of each resume with the job description
         
-        1. Key Strengths:
-        - List the candidate's key strengths that match the job requirements
-        - Focus on relevant experience, skills, and achievements
-        - Use bullet points for clarity
+    Returns:
+        List[Optional[dict]]: Analysis per resume, or None where the call did not produce one
+    """
+    try:
+        analyses = await _analyze_together(
+            _clip(job_desc, JOB_DESC_TOKEN_BUDGET),
+            [_clip(text, RESUME_TOKEN_BUDGET) for text in resume_texts]
+        )
+    except Exception as e:
+        logger.warning("Multi-resume analysis failed, falling back to single analyses: %s", e)
+        return [None] * len(resume_texts)
+    
+    results = []
+    for index, (text, cache_key) in enumerate(zip(resume_texts, cache_keys)):
+        sections = analyses.get(index)
+        if sections is not None:
+            await _analysis_cache.set(cache_key, dict(sections), ANALYSIS_CACHE_TTL)
+            await asyncio.to_thread(_semantic_cache.add, text + "\n\n" + job_desc, dict(sections))
+        results.append(sections)
+    return results
+
+async def analyze_resumes(resume_texts: List[str], job_desc: str) -> List[dict]:
+    """
+    Analyze several resumes against the same job description.
+    
+    Uncached resumes are packed into as few multi-analysis calls as the prompt
+    budget allows, so the job description is sent once per call rather than once
+    per resume. A resume that does not fit with others, or that a multi-analysis
+    call fails to cover, falls back to analyze_resume.
+    
+    Args:
+        resume_texts (List[str]): The text content of each resume
+        job_desc (str): The job description to analyze against
         
-        2. Areas for Improvement:
-        - Identify gaps between the resume and job requirements
-        - List missing skills or experience
-        - Highlight areas that need enhancement
-        - Use bullet points for clarity
+    Returns:
+        List[dict]: Analysis results for each resume, in the order given
         
-        3. Suggestions:
-        - Provide specific, actionable suggestions to improve the resume
-        - Include recommendations for better presentation
-        - Suggest ways to highlight relevant experience
-        - Use bullet points for clarity
+    Raises:
+        HTTPException: If there's an error in the analysis process
+    """
+    cache_keys = [make_cache_key(ANALYSIS_MODEL, resume=text, jd=job_desc) for text in resume_texts]
+    results = list(await asyncio.gather(*[_analysis_cache.get(key) for key in cache_keys]))
+    
+    # Pack uncached resumes into groups that fit the multi-analysis limits
+    encoding = _get_encoding()
+    budget = MULTI_ANALYSIS_PROMPT_BUDGET - len(encoding.encode(_clip(job_desc, JOB_DESC_TOKEN_BUDGET)))
+    groups: List[List[int]] = []
+    used = 0
+    for index, cached in enumerate(results):
+        if cached is not None:
+            continue
+        tokens = len(encoding.encode(_clip(resume_texts[index], RESUME_TOKEN_BUDGET)))
+        if not groups or used + tokens > budget or len(groups[-1]) >= MULTI_ANALYSIS_MAX_RESUMES:
+            groups.append([])
+            used = 0
+        groups[-1].append(index)
+        used += tokens
+    
+    multi_groups = [group for group in groups if len(group) > 1]
+    group_results = await asyncio.gather(*[
+        _analyze_group([resume_texts[i] for i in group], job_desc, [cache_keys[i] for i in group])
+        for group in multi_groups
+    ])
+    for group, analyses in zip(multi_groups, group_results):
+        for index, sections in zip(group, analyses):
+            results[index] = sections
+    
+    missing = [index for index, result in enumerate(results) if result is None]
+    fallbacks = await asyncio.gather(*[analyze_resume(resume_texts[i], job_desc) for i in missing])
+    for index, sections in zip(missing, fallbacks):
+        results[index] = sections
+    
+    return [dict(result) for result in results]
+
+def _sse_event(event: str, data: dict) -> str:
+    """Format one Server-Sent Events message with a JSON payload."""
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+async def _stream_uncached(resume_text: str, job_desc: str, cache_key: str, deltas: asyncio.Queue) -> dict:
+    """
+    Stream an analysis from Groq into a queue, then parse and cache it.
+    
+    The queue is unbounded, so the upstream stream is read at Groq's pace and the
+    concurrency slot is released as soon as it ends, however slowly the client
+    consumes the deltas. None is put on the queue once no more deltas will follow.
+    
+    Args:
+        resume_text (str): The text content of the resume
+        job_desc (str): The job description to analyze against
+        cache_key (str): Cache key of the resume and job description
+        deltas (asyncio.Queue): Receives each chunk of generated text
         
-        Format the response with clear section headers and bullet points for each item.
-        """
+    Returns:
+        dict: Analysis results containing strengths, weaknesses, and suggestions
         
-        print("\n=== Making API Call ===")
-        try:
-            completion = client.chat.completions.create(
-                model="meta-llama/llama-4-maverick-17b-128e-instruct",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """You are a professional resume optimization expert.
-                        Your task is to analyze resumes against job descriptions and provide
-                        detailed, actionable feedback.
-                        
-                        Important rules:
-                        1. Be specific and actionable in your feedback
-                        2. Focus on concrete examples and suggestions
-                        3. Use bullet points for clarity
-                        4. Maintain a professional and constructive tone
-                        5. Structure the response with clear section headers
-                        6. Ensure each section has at least 3-5 points
-                        """
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=1000
-            )
-            
-            # Process the response
-            response_text = completion.choices[0].message.content.strip()
-            print("\n=== Raw Response from Groq ===")
-            print(response_text)
-            
-            # Parse the response into sections
-            sections = {
-                "strengths": "",
-                "weaknesses": "",
-                "suggestions": ""
-            }
-            
-            # Try different section header formats
-            strength_headers = ["1. Key Strengths:", "### Key Strengths:", "Key Strengths:"]
-            weakness_headers = ["2. Areas for Improvement:", "### Areas for Improvement:", "Areas for Improvement:"]
-            suggestion_headers = ["3. Suggestions:", "### Suggestions:", "Suggestions:"]
-            
-            # Find the first occurrence of any strength header
-            strength_start = -1
-            for header in strength_headers:
-                if header in response_text:
-                    strength_start = response_text.find(header) + len(header)
-                    break
-            
-            if strength_start != -1:
-                # Get the text after the strength header
-                remaining_text = response_text[strength_start:]
-                
-                # Find the first occurrence of any weakness header
-                weakness_start = -1
-                for header in weakness_headers:
-                    if header in remaining_text:
-                        weakness_start = remaining_text.find(header)
-                        break
-                
-                if weakness_start != -1:
-                    # Extract strengths section
-                    sections["strengths"] = clean_markdown(remaining_text[:weakness_start].strip())
-                    
-                    # Get the text after the weakness header
-                    remaining_text = remaining_text[weakness_start:]
-                    for header in weakness_headers:
-                        if header in remaining_text:
-                            remaining_text = remaining_text[remaining_text.find(header) + len(header):]
-                            break
-                    
-                    # Find the first occurrence of any suggestion header
-                    suggestion_start = -1
-                    for header in suggestion_headers:
-                        if header in remaining_text:
-                            suggestion_start = remaining_text.find(header)
-                            break
-                    
-                    if suggestion_start != -1:
-                        # Extract weaknesses section
-                        sections["weaknesses"] = clean_markdown(remaining_text[:suggestion_start].strip())
-                        
-                        # Extract suggestions section
-                        remaining_text = remaining_text[suggestion_start:]
-                        for header in suggestion_headers:
-                            if header in remaining_text:
-                                sections["suggestions"] = clean_markdown(remaining_text[remaining_text.find(header) + len(header):].strip())
-                                break
-            
-            # Ensure all sections have content
-            if not sections["strengths"]:
-                sections["strengths"] = "No key strengths identified"
-            if not sections["weaknesses"]:
-                sections["weaknesses"] = "No areas for improvement identified"
-            if not sections["suggestions"]:
-                sections["suggestions"] = "No specific suggestions provided"
-            
-            print("\n=== Final Sections ===")
-            print("Strengths:", sections["strengths"])
-            print("Weaknesses:", sections["weaknesses"])
-            print("Suggestions:", sections["suggestions"])
-            
-            return sections
-            
-        except Exception as e:
-            print(f"Groq API error: {str(e)}")
-            raise HTTPException(status_code=500, detail=f"Groq API error: {str(e)}")
-            
+    Raises:
+        HTTPException: If the Groq API call fails or returns unusable output
+    """
+    # JSON mode does not support streaming; the system prompt alone asks for JSON
+    params = _completion_params(_build_prompt(resume_text, job_desc))
+    del params["response_format"]
+    try:
+        chunks = []
+        async with _get_analysis_slots():
+            async for chunk in await _create_completion(**params, stream=True):
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    chunks.append(delta)
+                    deltas.put_nowait(delta)
+        deltas.put_nowait(None)
+        
+        sections = _parse_sections("".join(chunks).strip())
+        await _analysis_cache.set(cache_key, dict(sections), ANALYSIS_CACHE_TTL)
+        await asyncio.to_thread(_semantic_cache.add, resume_text + "\n\n" + job_desc, dict(sections))
+        return sections
+    except Exception as e:
+        deltas.put_nowait(None)
+        logger.error("Error streaming analysis: %s", e)
+        raise HTTPException(status_code=500, detail=f"Groq API error: {str(e)}")
+
+async def stream_analysis(resume_text: str, job_desc: str) -> AsyncIterator[str]:
+    """
+    Analyze a resume against a job description, streaming tokens as Server-Sent Events.
+    
+    Emits a `delta` event for each chunk of generated text, then a single
+    `result` event carrying the parsed analysis in the same format as
+    analyze_resume. Cached analyses, and analyses already in flight for the
+    same inputs, are sent as the `result` event alone. A streamed analysis is
+    registered as in flight too, so concurrent analyze_resume calls join it.
+    Failures are reported as an `error` event, since the response status has
+    already been sent.
+    
+    Args:
+        resume_text (str): The text content of the resume
+        job_desc (str): The job description to analyze against
+        
+    Yields:
+        str: Formatted Server-Sent Events messages
+    """
+    cache_key = make_cache_key(ANALYSIS_MODEL, resume=resume_text, jd=job_desc)
+    cached = await _analysis_cache.get(cache_key)
+    if cached is None:
+        cached = await asyncio.to_thread(_semantic_cache.lookup, resume_text + "\n\n" + job_desc)
+    if cached is not None:
+        yield _sse_event("result", dict(cached))
+        return
+    
+    # No await between the lookup and the insert, so no lock is needed on the event loop
+    task = _inflight.get(cache_key)
+    if task is None:
+        deltas: asyncio.Queue = asyncio.Queue()
+        task = asyncio.ensure_future(_stream_uncached(resume_text, job_desc, cache_key, deltas))
+        _inflight[cache_key] = task
+        task.add_done_callback(lambda done: _forget_inflight(cache_key, done))
+        while (delta := await deltas.get()) is not None:
+            yield _sse_event("delta", {"delta": delta})
+    else:
+        logger.debug("Joining in-flight analysis")
+    
+    try:
+        # Shielded so a disconnecting client does not cancel the analysis for joined callers
+        sections = dict(await asyncio.shield(task))
     except Exception as e:
-        print(f"Error in analyze_resume: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to analyze resume: {str(e)}")
\ No newline at end of file
+        detail = e.detail if isinstance(e, HTTPException) else str(e)
+        yield _sse_event("error", {"detail": f"Failed to analyze resume: {detail}"})
+        return
+    yield _sse_event("result", sections)
+
+async def submit_analysis_batch(pairs: List[Tuple[str, str]]) -> str:
+    """
+    Submit many resume analyses as one Groq batch job for offline processing.
+    
+    Batch jobs are billed at a discount and bypass the per-minute rate limits,
+    but complete within a 24 hour window instead of immediately.
+    
+    Args:
+        pairs (List[Tuple[str, str]]): (resume_text, job_description) pairs
+        
+    Returns:
+        str: The batch ID to poll with get_analysis_batch
+    """
+    bodies = [_completion_params(_build_prompt(resume_text, job_desc)) for resume_text, job_desc in pairs]
+    return await submit_batch(_GROQ_CLIENT, bodies)
+
+async def get_analysis_batch(batch_id: str) -> dict:
+    """
+    Check a batch of resume analyses and return the results once it has finished.
+    
+    Args:
+        batch_id (str): ID returned by submit_analysis_batch
+        
+    Returns:
+        dict: The batch status, and once finished the analyses in submission order.
+        Analyses that failed inside the batch are None.
+    """
+    batch = await _GROQ_CLIENT.batches.retrieve(batch_id)
+    if batch.status not in FINAL_STATUSES:
+        return {"status": batch.status}
+    
+    contents = await fetch_batch_results(_GROQ_CLIENT, batch)
+    results = []
+    for i in range(batch_request_count(batch, contents)):
+        try:
+            results.append(_parse_sections(contents[i].strip()) if i in contents else None)
+        except ValueError as e:
+            logger.warning("Batch analysis %d unusable: %s", i, e)
+            results.append(None)
+    return {"status": batch.status, "results": results}
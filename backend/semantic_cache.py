@@ -0,0 +1,142 @@
+"""
+Semantic Cache
+------------
+Embedding-based cache for LLM responses. Near-duplicate prompts (for example a
+resume resubmitted with one edited bullet) are matched by cosine similarity and
+answered from the cache instead of another Groq round-trip.
+
+The cache is optional. It needs `sentence-transformers` and `faiss-cpu`, and is
+only active when SEMANTIC_CACHE_ENABLED is set to a true value. Otherwise every
+lookup misses and nothing is stored.
+
+Entries can optionally be persisted to a SQLite file so the cache survives restarts.
+"""
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+import orjson
+
+try:
+    import numpy as np
+    import faiss
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Optional dependencies
+    faiss = None
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+_model = None
+_model_lock = threading.Lock()
+
+def _get_model():
+    """Load the embedding model once per process, on first use."""
+    global _model
+    with _model_lock:
+        if _model is None:
+            _model = SentenceTransformer(EMBEDDING_MODEL)
+        return _model
+
+def semantic_cache_enabled() -> bool:
+    """Return True when the optional dependencies are installed and the cache is switched on."""
+    return faiss is not None and os.getenv("SEMANTIC_CACHE_ENABLED", "").lower() in ("1", "true", "yes")
+
+class SemanticCache:
+    """
+    In-memory cache of (embedding, value) pairs searched by cosine similarity.
+
+    Vectors are L2-normalised, so the inner product of an IndexFlatIP equals
+    cosine similarity. The least recently used entry is evicted once max_entries
+    is reached. Values must be JSON-serializable when persist_path is given.
+    """
+
+    def __init__(self, threshold: float = 0.97, max_entries: int = 1000, persist_path: Optional[str] = None):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.enabled = semantic_cache_enabled()
+        self._lock = threading.Lock()
+        self._index = None
+        # Entry ID -> cached value, least recently used first
+        self._values: "OrderedDict[int, Any]" = OrderedDict()
+        self._next_id = 0
+        self._db = None
+        if self.enabled and persist_path:
+            self._load(persist_path)
+
+    def _load(self, persist_path: str) -> None:
+        """Open the SQLite store and rebuild the index from the entries saved in it."""
+        self._db = sqlite3.connect(persist_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries (id INTEGER PRIMARY KEY, vector BLOB, value BLOB)"
+        )
+        for entry_id, vector, value in self._db.execute("SELECT id, vector, value FROM entries ORDER BY id"):
+            self._insert(entry_id, np.frombuffer(vector, dtype=np.float32).reshape(1, -1), orjson.loads(value))
+            self._next_id = entry_id + 1
+        self._evict()
+        self._db.commit()
+
+    def _insert(self, entry_id: int, vector, value: Any) -> None:
+        if self._index is None:
+            self._index = faiss.IndexIDMap(faiss.IndexFlatIP(vector.shape[1]))
+        self._index.add_with_ids(vector, np.array([entry_id], dtype=np.int64))
+        self._values[entry_id] = value
+
+    def _evict(self) -> None:
+        while len(self._values) > self.max_entries:
+            oldest, _ = self._values.popitem(last=False)
+            self._index.remove_ids(np.array([oldest], dtype=np.int64))
+            if self._db is not None:
+                self._db.execute("DELETE FROM entries WHERE id = ?", (oldest,))
+
+    def _embed(self, text: str):
+        return _get_model().encode([text], normalize_embeddings=True).astype(np.float32)
+
+    def lookup(self, text: str) -> Optional[Any]:
+        """
+        Return the cached value for the most similar stored text, if close enough.
+
+        Args:
+            text (str): Canonical prompt text to match
+
+        Returns:
+            Optional[Any]: The cached value, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        vector = self._embed(text)
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0:
+                return None
+            scores, ids = self._index.search(vector, 1)
+            entry_id = int(ids[0][0])
+            if entry_id != -1 and scores[0][0] >= self.threshold and entry_id in self._values:
+                self._values.move_to_end(entry_id)
+                return self._values[entry_id]
+        return None
+
+    def add(self, text: str, value: Any) -> None:
+        """
+        Store a value under the embedding of the given text.
+
+        Args:
+            text (str): Canonical prompt text
+            value (Any): Value to return for similar prompts
+        """
+        if not self.enabled:
+            return
+        vector = self._embed(text)
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._insert(entry_id, vector, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT INTO entries (id, vector, value) VALUES (?, ?, ?)",
+                    (entry_id, vector.tobytes(), orjson.dumps(value))
+                )
+            self._evict()
+            if self._db is not None:
+                self._db.commit()
@@ -10,6 +10,7 @@ export const API_BASE_URL = isLovablePreview
 // API Endpoints
 export const API_ENDPOINTS = {
   GENERATE_RESUME: `${API_BASE_URL}/generate-resume`,
+  RESUME_PDF: `${API_BASE_URL}/pdf`,
   ANALYZE_RESUME: `${API_BASE_URL}/analyze-resume`,
   GENERATE_PORTFOLIO: `${API_BASE_URL}/api/generate-portfolio`,
   GENERATE_COVER_LETTER: `${API_BASE_URL}/api/generate-cover-letter`,
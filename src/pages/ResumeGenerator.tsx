@@ -113,6 +113,37 @@ interface GeneratedResume {
   pdfUrl?: string;
 }
 
+// Polling schedule for the background PDF render of a generated resume
+const PDF_POLL_INTERVAL_MS = 1000;
+const PDF_POLL_ATTEMPTS = 30;
+
+const base64ToPdfUrl = (pdfBase64: string): string => {
+  const pdfBytes = atob(pdfBase64);
+  const pdfArray = new Uint8Array(pdfBytes.length);
+  for (let i = 0; i < pdfBytes.length; i++) {
+    pdfArray[i] = pdfBytes.charCodeAt(i);
+  }
+  const pdfBlob = new Blob([pdfArray], { type: 'application/pdf' });
+  return URL.createObjectURL(pdfBlob);
+};
+
+// Wait for a background PDF job; resolves to an object URL, or null if it fails or times out
+const pollResumePdf = async (jobId: string): Promise<string | null> => {
+  for (let attempt = 0; attempt < PDF_POLL_ATTEMPTS; attempt++) {
+    const response = await fetch(`${API_ENDPOINTS.RESUME_PDF}/${jobId}`);
+    if (response.status === 202) {
+      await new Promise((resolve) => setTimeout(resolve, PDF_POLL_INTERVAL_MS));
+      continue;
+    }
+    if (!response.ok) {
+      return null;
+    }
+    const data = await response.json();
+    return data.pdf ? base64ToPdfUrl(data.pdf) : null;
+  }
+  return null;
+};
+
 const ResumeGenerator = () => {
   const [linkedInUrl, setLinkedInUrl] = useState("");
   const [isGenerating, setIsGenerating] = useState(false);
@@ -288,21 +319,24 @@ const ResumeGenerator = () => {
         if (data.status === "success") {
           // Convert base64 PDF to blob for preview
           if (data.pdf) {
-            const pdfBytes = atob(data.pdf);
-            const pdfArray = new Uint8Array(pdfBytes.length);
-            for (let i = 0; i < pdfBytes.length; i++) {
-              pdfArray[i] = pdfBytes.charCodeAt(i);
-            }
-            const pdfBlob = new Blob([pdfArray], { type: 'application/pdf' });
-            const pdfUrl = URL.createObjectURL(pdfBlob);
-            
             // Store the PDF URL for later use
             setGeneratedResume({
               ...data.resume,
-              pdfUrl
+              pdfUrl: base64ToPdfUrl(data.pdf)
             });
           } else {
             setGeneratedResume(data.resume);
+            // The PDF renders in the background; attach it to the preview once ready.
+            // If it never arrives, downloading falls back to requesting the PDF directly.
+            if (data.pdf_job_id) {
+              pollResumePdf(data.pdf_job_id)
+                .then((pdfUrl) => {
+                  if (pdfUrl) {
+                    setGeneratedResume((prev) => (prev ? { ...prev, pdfUrl } : prev));
+                  }
+                })
+                .catch((error) => console.error("Error fetching resume PDF:", error));
+            }
           }
           toast.success("Resume generated successfully!");
         } else {